@@ -0,0 +1,344 @@
+"""
+Benchmarks of grammar analysis and parsing.
+
+Usage::
+
+    python -m src.benchmark [--max-size 100M] [--output results.json] [--baseline old.json]
+
+Every benchmark is timed on grammars of increasing size or inputs of
+increasing length, keeping the best of several repetitions. The results
+can be written as JSON and compared with a previous run.
+"""
+from __future__ import annotations
+
+import argparse
+import functools
+import itertools
+import json
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.grammar import Grammar, analysis_cache
+
+BENCHMARK_VERSION = 3 # 2: grammar phases are timed apart, without building the grammar. 3: generated grammars have short derivations
+
+_EXPRESSION_GRAMMAR = {
+    "E": ["TX"],
+    "X": ["+E", ""],
+    "T": ["iY", "(E)"],
+    "Y": ["*T", ""],
+}
+
+
+class BenchmarkResult(NamedTuple):
+    """Best time of a benchmark for a size (of grammar or input)."""
+    name: str
+    size: int
+    seconds: float
+
+
+def _best_time(
+    function: Callable[..., Any],
+    repeat: int,
+    budget: float,
+    setup: Optional[Callable[[], Any]] = None,
+) -> float:
+    """
+    Best time of several calls, stopping early once the budget is spent.
+    If there is a setup function, it runs untimed before every call, which
+    receives its result.
+    """
+    best = float("inf")
+    spent = 0.0
+    for _ in range(repeat):
+        args = () if setup is None else (setup(),)
+        start = time.perf_counter()
+        function(*args)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        spent += elapsed
+        if spent > budget:
+            break
+    return best
+
+
+def parse_size(text: str) -> int:
+    """Size such as 100, 10K, 1M or 100M, in bytes."""
+    units = {"K": 10 ** 3, "M": 10 ** 6, "G": 10 ** 9}
+    text = text.strip().upper()
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def input_sizes(max_size: int, min_size: int = 1000) -> List[int]:
+    """Powers of ten from min_size to max_size."""
+    sizes = []
+    size = min_size
+    while size <= max_size:
+        sizes.append(size)
+        size *= 10
+    return sizes
+
+
+def expression_input(size: int) -> str:
+    """Correct input of the expression grammar with about size characters."""
+    unit = "i*(i+i)+"
+    return unit * max(0, (size - 2) // len(unit)) + "i$"
+
+
+def layered_grammar(levels: int) -> Grammar:
+    """
+    LL(1) expression grammar with a precedence level per operator, with
+    2 * levels + 1 non terminals:
+
+        E<k> -> E<k+1> R<k>
+        R<k> -> op<k> E<k+1> R<k> | lambda
+        E<levels> -> id | ( E0 )
+    """
+    terminals = {"id", "(", ")"} | {f"op{k}" for k in range(levels)}
+    productions: Dict[str, List[Sequence[str]]] = {}
+    for k in range(levels):
+        productions[f"E{k}"] = [(f"E{k + 1}", f"R{k}")]
+        productions[f"R{k}"] = [(f"op{k}", f"E{k + 1}", f"R{k}"), ()]
+    productions[f"E{levels}"] = [("id",), ("(", "E0", ")")]
+    return Grammar(terminals, set(productions), productions, "E0")
+
+
+def _fresh_grammar(build: Callable[[], Grammar], phases: int = 0) -> Grammar:
+    """
+    Newly built grammar, with its fingerprint and the given number of
+    analysis phases (first, then follow) already computed, so that only
+    the next phase is timed.
+    """
+    analysis_cache.clear() # Equal grammars analyzed before must not be reused
+    grammar = build()
+    grammar.fingerprint()
+    if phases >= 1:
+        grammar.compute_first((grammar.axiom,))
+    if phases >= 2:
+        grammar.compute_follow(grammar.axiom)
+    return grammar
+
+
+def _grammar_benchmarks(levels: Sequence[int], repeat: int, budget: float) -> Iterator[BenchmarkResult]:
+    for n in levels:
+        build = functools.partial(layered_grammar, n)
+        size = 2 * n + 1
+        yield BenchmarkResult("grammar.compute_first", size, _best_time(
+            lambda grammar: grammar.compute_first((grammar.axiom,)), repeat, budget, # The sets of every non terminal
+            lambda: _fresh_grammar(build),
+        ))
+        yield BenchmarkResult("grammar.compute_follow", size, _best_time(
+            lambda grammar: grammar.compute_follow(grammar.axiom), repeat, budget,
+            lambda: _fresh_grammar(build, 1),
+        ))
+        yield BenchmarkResult("grammar.get_ll1_table", size, _best_time(
+            lambda grammar: grammar.get_ll1_table(), repeat, budget,
+            lambda: _fresh_grammar(build, 2),
+        ))
+
+
+def _generated_benchmarks(sizes: Sequence[int], repeat: int, budget: float) -> Iterator[BenchmarkResult]:
+    from src.generator import SentenceGenerator, generate_grammar
+
+    for n in sizes:
+        yield BenchmarkResult("generated.get_ll1_table", n, _best_time( # Every phase of the analysis
+            lambda grammar: grammar.get_ll1_table(), repeat, budget,
+            lambda: _fresh_grammar(functools.partial(generate_grammar, n, seed=n)),
+        ))
+        grammar = generate_grammar(n, seed=n)
+        ll1_table = grammar.get_ll1_table()
+        assert ll1_table is not None
+        sentences = SentenceGenerator(ll1_table, grammar.axiom, seed=n)
+        tokens = sentences.compiled.encode(sentences.sentence(10 ** 4))
+        yield BenchmarkResult("generated.recognize_10k", n, _best_time(
+            lambda: sentences.compiled.recognize(tokens, grammar.axiom), repeat, budget,
+        ))
+
+
+def _parsing_benchmarks(sizes: Sequence[int], tree_max_size: int, repeat: int, budget: float) -> Iterator[BenchmarkResult]:
+    from src.codegen import compile_table
+
+    grammar = Grammar({"+", "*", "i", "(", ")"}, set(_EXPRESSION_GRAMMAR), _EXPRESSION_GRAMMAR, "E")
+    table = grammar.get_ll1_table()
+    assert table is not None
+    compiled = table.compile()
+    generated = compile_table(table)
+
+    for size in sizes:
+        data = expression_input(size)
+        cases: List[Tuple[str, Callable[[], Any], bool]] = [
+            ("LL1Table.analyze", lambda: table.analyze(data, "E"), True),
+            ("CompiledLL1Table.analyze", lambda: compiled.analyze(data, "E"), True),
+            ("CompiledLL1Table.analyze_flat", lambda: compiled.analyze_flat(data, "E"), True),
+            ("generated.analyze", lambda: generated.analyze(data, "E"), True),
+            ("LL1Table.recognize", lambda: table.recognize(data, "E"), False),
+            ("CompiledLL1Table.recognize", lambda: compiled.recognize(data, "E"), False),
+            ("generated.recognize", lambda: generated.recognize(data, "E"), False),
+        ]
+        for name, function, builds_tree in cases:
+            if builds_tree and size > tree_max_size: # Trees of every node would not fit in memory
+                continue
+            yield BenchmarkResult(name, size, _best_time(function, repeat, budget))
+        del data
+
+
+def _ply_benchmarks(sizes: Sequence[int], ply_max_size: int, repeat: int, budget: float) -> Iterator[BenchmarkResult]:
+    from src import roman_codec
+    from src.g1_parser import get_parser as get_g1_parser, recognize_stream
+    from src.roman_parser import get_parser as get_roman_parser
+
+    g1 = get_g1_parser()
+    roman = get_roman_parser()
+    for size in sizes:
+        n = max(1, size // 3)
+        data = "a" * n + "b" * n + "c" * (size - 2 * n)
+        if size <= ply_max_size: # The LALR stack grows with the input
+            yield BenchmarkResult("g1_parser.parse", size, _best_time(lambda: g1.parse(data), repeat, budget))
+        yield BenchmarkResult("g1_parser.recognize_stream", size, _best_time(
+            lambda: recognize_stream(data[i:i + 65536] for i in range(0, len(data), 65536)), repeat, budget,
+        ))
+
+        every = roman_codec.encode_many(range(roman_codec.MAX_VALUE + 1))
+        count = max(1, size * len(every) // sum(map(len, every))) # About size characters in all
+        numerals = list(itertools.islice(itertools.cycle(every), count))
+        if size <= ply_max_size:
+            yield BenchmarkResult("roman_parser.parse", size, _best_time(
+                lambda: [roman.parse(x) for x in numerals], repeat, budget,
+            ))
+        yield BenchmarkResult("roman_codec.decode_many", size, _best_time(lambda: roman_codec.decode_many(numerals), repeat, budget))
+
+
+def run(
+    max_size: int = 10 ** 6,
+    levels: Sequence[int] = (4, 16, 64, 256),
+    generated: Sequence[int] = (10, 100, 1000, 10000),
+    tree_max_size: int = 10 ** 6,
+    ply_max_size: int = 10 ** 5,
+    repeat: int = 5,
+    budget: float = 2.0,
+    progress: Optional[Callable[[BenchmarkResult], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Runs every benchmark.
+
+    Args:
+        max_size: largest input, in characters.
+        levels: precedence levels of the grammars to analyze.
+        generated: numbers of non terminals of the generated grammars to
+          analyze (see src.generator).
+        tree_max_size: largest input for the benchmarks that build a tree.
+        ply_max_size: largest input for the PLY parsers.
+        repeat: repetitions of every measure, keeping the best.
+        budget: seconds after which a measure is not repeated.
+        progress: function called with every result.
+
+    Returns:
+        Dictionary with the environment and the results, ready for JSON.
+    """
+    sizes = input_sizes(max_size)
+    results = []
+    for generator in (
+        _grammar_benchmarks(levels, repeat, budget),
+        _generated_benchmarks(generated, repeat, budget),
+        _parsing_benchmarks(sizes, tree_max_size, repeat, budget),
+        _ply_benchmarks(sizes, ply_max_size, repeat, budget),
+    ):
+        for result in generator:
+            if progress is not None:
+                progress(result)
+            results.append(result._asdict())
+    return {
+        "version": BENCHMARK_VERSION,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 1.1) -> List[Dict[str, Any]]:
+    """
+    Compares two runs.
+
+    Args:
+        results: output of run.
+        baseline: output of an earlier run.
+        threshold: ratio of times above which a result is a regression.
+
+    Returns:
+        For every benchmark and size present in both runs, the two times,
+        their ratio and whether it is a regression.
+
+    Raises:
+        ValueError: if the runs come from different versions of the
+          benchmarks, whose times measure different things.
+    """
+    if baseline.get("version") != results.get("version"):
+        raise ValueError(
+            f"Baseline of version {baseline.get('version')} cannot be compared with results of version {results.get('version')}."
+        )
+    old = {(r["name"], r["size"]): r["seconds"] for r in baseline["results"]}
+    rows = []
+    for r in results["results"]:
+        key = (r["name"], r["size"])
+        if key in old and old[key] > 0:
+            ratio = r["seconds"] / old[key]
+            rows.append({
+                "name": r["name"],
+                "size": r["size"],
+                "seconds": r["seconds"],
+                "baseline": old[key],
+                "ratio": ratio,
+                "regression": ratio > threshold,
+            })
+    return rows
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--max-size", default="1M", help="largest input, such as 1M or 100M (default 1M)")
+    parser.add_argument("--tree-max-size", default="1M", help="largest input when building trees (default 1M)")
+    parser.add_argument("--ply-max-size", default="100K", help="largest input for the PLY parsers (default 100K)")
+    parser.add_argument("--levels", default="4,16,64,256", help="precedence levels of the analyzed grammars")
+    parser.add_argument("--generated", default="10,100,1000,10000", help="non terminals of the generated grammars")
+    parser.add_argument("--repeat", type=int, default=5, help="repetitions of every measure (default 5)")
+    parser.add_argument("--output", help="JSON file for the results")
+    parser.add_argument("--baseline", help="JSON file of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=1.1, help="slowdown ratio reported as regression (default 1.1)")
+    args = parser.parse_args(argv)
+
+    results = run(
+        max_size=parse_size(args.max_size),
+        levels=[int(x) for x in args.levels.split(",")],
+        generated=[int(x) for x in args.generated.split(",")],
+        tree_max_size=parse_size(args.tree_max_size),
+        ply_max_size=parse_size(args.ply_max_size),
+        repeat=args.repeat,
+        progress=lambda r: print(f"{r.name:32} {r.size:>11} {r.seconds * 1000:12.3f} ms", flush=True),
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            json.dump(results, fp, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fp:
+            baseline = json.load(fp)
+        try:
+            rows = compare(results, baseline, args.threshold)
+        except ValueError as error:
+            print(error, file=sys.stderr)
+            return 2
+        print()
+        for row in rows:
+            mark = "  REGRESSION" if row["regression"] else ""
+            print(f"{row['name']:32} {row['size']:>11} {row['ratio']:8.2f}x{mark}")
+        if any(row["regression"] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
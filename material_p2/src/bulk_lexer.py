@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from types import ModuleType
+from typing import Dict, List, Mapping, Optional, Sequence, Union
+
+_IGNORED = 254 # Byte of the ignored characters in the checking pass
+_ILLEGAL = 255 # Byte of the characters that are not tokens
+_SPECIAL = ".^$*+?{}[]\\|()" # Characters that are not literals in a regular expression
+
+
+class IllegalCharacterError(Exception):
+    """
+    Exception for characters that are not tokens.
+
+    Attributes:
+        offset: position of the first illegal character in the input.
+        char: the illegal character.
+    """
+
+    def __init__(self, offset: int, char: str) -> None:
+        super().__init__(f"Illegal character {char!r} at offset {offset}")
+        self.offset = offset
+        self.char = char
+
+
+class BulkLexer:
+    """
+    Lexer for alphabets of single character tokens. The whole input is
+    mapped to token ids at once with bytes.translate, instead of matching
+    a regular expression and creating a token object per character.
+
+    Args:
+        chars: character of every token type.
+        ignore: characters to skip, like t_ignore in PLY.
+        ids: id of every token type, below 254. By default, the position
+          of the token type in chars. The terminal ids of a
+          CompiledLL1Table can be used, so the output can be analyzed
+          directly.
+    """
+
+    def __init__(
+        self,
+        chars: Mapping[str, str],
+        ignore: str = "",
+        ids: Optional[Mapping[str, int]] = None,
+    ) -> None:
+        if ids is None:
+            ids = {name: k for k, name in enumerate(chars)}
+        if not all(name in ids for name in chars):
+            raise ValueError("Every token needs an id.")
+        self.ids: Dict[str, int] = {name: ids[name] for name in chars}
+        self.names: List[Optional[str]] = [None] * (max(self.ids.values(), default=-1) + 1) # Token type of every id
+        for name, i in self.ids.items():
+            self.names[i] = name
+
+        table = bytearray([_ILLEGAL]) * 256
+        for name, char in chars.items():
+            if len(char) != 1 or not char.isascii():
+                raise ValueError(f"Token {name} is not a single ASCII character.")
+            if not 0 <= self.ids[name] < _IGNORED:
+                raise ValueError(f"Invalid id for token {name}.")
+            table[ord(char)] = self.ids[name]
+        if not ignore.isascii():
+            raise ValueError("Ignored characters must be ASCII.")
+        for char in ignore:
+            table[ord(char)] = _IGNORED
+        self._table = bytes(table)
+        self._ignore = ignore.encode("ascii")
+
+    @classmethod
+    def from_module(cls, module: ModuleType, ids: Optional[Mapping[str, int]] = None) -> BulkLexer:
+        """
+        Builds the lexer from the tokens, t_<token> and t_ignore definitions
+        of a PLY lexer module.
+
+        Args:
+            module: PLY lexer module.
+            ids: id of every token type (see BulkLexer).
+
+        Returns:
+            BulkLexer for the tokens of the module.
+
+        Raises:
+            ValueError: if some token is not a single literal character.
+        """
+        chars: Dict[str, str] = {}
+        for name in module.tokens:
+            pattern = getattr(module, f"t_{name}", None)
+            if not isinstance(pattern, str):
+                raise ValueError(f"Token {name} is not defined by a string.")
+            if len(pattern) == 2 and pattern[0] == "\\" and not pattern[1].isalnum(): # Escaped literal
+                pattern = pattern[1]
+            elif len(pattern) != 1 or pattern in _SPECIAL:
+                raise ValueError(f"Token {name} is not a single literal character.")
+            chars[name] = pattern
+        return cls(chars, getattr(module, "t_ignore", ""), ids)
+
+    def tokenize(self, data: Union[str, bytes]) -> bytes:
+        """
+        Maps an input to the ids of its tokens.
+
+        Args:
+            data: input text.
+
+        Returns:
+            Id of every token, one byte each, without the ignored
+            characters.
+
+        Raises:
+            IllegalCharacterError: for the first character that is not a
+              token nor ignored.
+        """
+        limit = None # Offset of the first non ASCII character, which is always illegal
+        if isinstance(data, str):
+            try:
+                raw = data.encode("ascii")
+            except UnicodeEncodeError as e:
+                limit = e.start
+                raw = data[:limit].encode("ascii")
+        else:
+            raw = bytes(data)
+
+        checked = raw.translate(self._table) # Same length as the input, so offsets are kept
+        offset = checked.find(_ILLEGAL)
+        if offset < 0:
+            offset = limit
+        if offset is not None:
+            char = data[offset]
+            raise IllegalCharacterError(offset, char if isinstance(char, str) else chr(char))
+        if self._ignore:
+            return raw.translate(self._table, self._ignore)
+        return checked
+
+    def token_types(self, ids: Sequence[int]) -> List[str]:
+        """
+        Token types of a sequence of ids.
+
+        Args:
+            ids: output of tokenize.
+
+        Returns:
+            Token type of every id.
+        """
+        names = self.names
+        return [names[i] for i in ids]
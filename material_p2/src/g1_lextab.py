@@ -0,0 +1,10 @@
+# g1_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('a', 'b', 'c'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_a>a)|(?P<t_b>b)|(?P<t_c>c)', [None, (None, 'a'), (None, 'b'), (None, 'c')])]}
+_lexstateignore = {'INITIAL': ' \t\n'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
@@ -1,9 +1,10 @@
-import ply.yacc as yacc
-from src.g1_lexer import tokens
+import sys
+
+from src.bulk_lexer import IllegalCharacterError
+from src.g1_lexer import get_bulk_lexer, get_lexer, tokens
+from src.ply_build import Lazy, build_parser
 
 # Grammar Rules for L = {a^n b^n c^k | k >= n + 1}
-global errorflagG1
-errorflagG1 = False
 
 def p_Language(p):
     """
@@ -15,7 +16,7 @@ def p_Language(p):
     k = p[3]["k"]  # Number of `c`s (from C)
 
     # Constraints
-    if nA != nB or k < nA + 1 or errorflagG1 is True:
+    if nA != nB or k < nA + 1 or p.parser.context.error:
         p[0] = False
     else:
         p[0] = True
@@ -77,12 +78,100 @@ def p_lambda(p):
 
 # Syntax error handling
 def p_error(p):
-    # Set up global variable flag for syntax error
-    errorflagG1 = True
+    # Syntax errors are recorded in the context of every parse (p.parser.context,
+    # see src.ply_build.BoundParser), which replaces this function
+    pass
+
+
+class G1StreamRecognizer:
+    """
+    Streaming evaluation of the same grammar: the input is fed in chunks
+    and nA, nB and k are accumulated as the tokens arrive, as the left
+    recursive rules A : A a, B : B b, C : C c would, so memory does not
+    grow with the length of the input.
+
+    Attributes:
+        nA: number of `a`s read.
+        nB: number of `b`s read.
+        k: number of `c`s read.
+        error: whether a syntax error was found.
+    """
+
+    def __init__(self) -> None:
+        self.nA = 0
+        self.nB = 0
+        self.k = 0
+        self.error = False
+        self._phase = 0 # Run being read: 0 for A, 1 for B, 2 for C
+        self._offset = 0 # Offset of the next chunk in the whole input
+
+    def feed(self, chunk):
+        """
+        Reads the next chunk of the input.
+
+        Raises:
+            IllegalCharacterError: for characters that are not tokens, as
+              the lexer does.
+        """
+        try:
+            ids = get_bulk_lexer().tokenize(chunk) # a, b, c are 0, 1, 2
+        except IllegalCharacterError as e:
+            e.offset += self._offset # Offset in the whole input
+            raise
+        self._offset += len(chunk)
+        if self.error:
+            return
+
+        if self._phase == 0:
+            rest = ids.lstrip(b"\0")
+            self.nA += len(ids) - len(rest)
+            ids = rest
+            if ids:
+                self._phase = 1
+        if self._phase == 1:
+            rest = ids.lstrip(b"\1")
+            self.nB += len(ids) - len(rest)
+            ids = rest
+            if ids:
+                self._phase = 2
+        if self._phase == 2:
+            rest = ids.lstrip(b"\2")
+            self.k += len(ids) - len(rest)
+            if rest: # An a or a b after the c's
+                self.error = True
+
+    def finish(self):
+        """
+        Ends the input.
+
+        Returns:
+            True if the input belongs to the language, False otherwise.
+        """
+        return not self.error and self.nA == self.nB and self.k >= self.nA + 1
+
+
+def recognize_stream(chunks):
+    """
+    Checks an input given in chunks with G1StreamRecognizer.
+
+    Returns:
+        True if the input belongs to the language, False otherwise.
+    """
+    recognizer = G1StreamRecognizer()
+    for chunk in chunks:
+        recognizer.feed(chunk)
+    return recognizer.finish()
+
+
+# Construir el parser la primera vez que se usa, a partir de src/g1_parsetab.py
+get_parser = Lazy(lambda: build_parser(sys.modules[__name__], "src.g1_parsetab", get_lexer()))
 
+__all__ = ["tokens", "get_parser", "parser", "G1StreamRecognizer", "recognize_stream"]
 
-# Construir el parser
-parser = yacc.yacc()
+def __getattr__(name):
+    if name == "parser":
+        return get_parser()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
     while True:
@@ -92,7 +181,7 @@ if __name__ == "__main__":
             break
         if not s:
             continue
-        result = parser.parse(s)
+        result = get_parser().parse(s)
         print(f"El valor numérico es:", result)
 
 
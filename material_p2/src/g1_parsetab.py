@@ -1,5 +1,5 @@
 
-# parsetab.py
+# g1_parsetab.py
 # This file is automatically generated. Do not edit.
 # pylint: disable=W,C,R
 _tabversion = '3.10'
@@ -27,12 +27,12 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> Language","S'",1,None,None,None),
-  ('Language -> A B C','Language',3,'p_Language','g1_parser.py',10),
-  ('A -> a A','A',2,'p_A','g1_parser.py',26),
-  ('A -> lambda','A',1,'p_A','g1_parser.py',27),
-  ('B -> b B','B',2,'p_B','g1_parser.py',41),
-  ('B -> lambda','B',1,'p_B','g1_parser.py',42),
-  ('C -> c C','C',2,'p_C','g1_parser.py',56),
-  ('C -> c','C',1,'p_C','g1_parser.py',57),
-  ('lambda -> <empty>','lambda',0,'p_lambda','g1_parser.py',71),
+  ('Language -> A B C','Language',3,'p_Language','g1_parser.py',12),
+  ('A -> a A','A',2,'p_A','g1_parser.py',28),
+  ('A -> lambda','A',1,'p_A','g1_parser.py',29),
+  ('B -> b B','B',2,'p_B','g1_parser.py',43),
+  ('B -> lambda','B',1,'p_B','g1_parser.py',44),
+  ('C -> c C','C',2,'p_C','g1_parser.py',58),
+  ('C -> c','C',1,'p_C','g1_parser.py',59),
+  ('lambda -> <empty>','lambda',0,'p_lambda','g1_parser.py',73),
 ]
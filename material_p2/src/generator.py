@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import heapq
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.grammar import CompiledLL1Table, Grammar, LL1Table
+
+
+def generate_grammar(
+    n_non_terminals: int,
+    seed: Optional[int] = None,
+    alternatives: int = 3,
+    max_body_length: int = 4,
+    nullable_ratio: float = 0.25,
+    recursion_ratio: float = 0.1,
+    terminal_ratio: float = 0.3,
+    n_terminals: int = 32,
+    separators: int = 4,
+) -> Grammar:
+    """
+    Generates a random grammar that is LL(1) by construction. Non
+    terminals are N0 (the axiom) to N<n-1>, and:
+
+    - every production starts with a terminal (t<k>) that no other
+      production of the same non terminal starts with;
+    - nullable non terminals get a lambda production, and every
+      occurrence of them is followed by a separator terminal (;<k>) that
+      starts no production, so their follow sets never meet their first
+      sets;
+    - the first production of N<i> mentions some N<j> with j > i right
+      after its first terminal, and no N<j> with j <= i, so every non
+      terminal derives some string and the axiom reaches every level.
+      Any other non terminal it mentions is nullable, so the shortest
+      string of N<i> has at most 2 * max_body_length + 1 tokens more
+      than the one of N<j>, instead of doubling at every level. The rest
+      may also mention N<j> with j <= i, which makes the grammar
+      recursive.
+
+    Args:
+        n_non_terminals: number of non terminals.
+        seed: seed of the random generator.
+        alternatives: maximum number of non lambda productions of a non
+          terminal, which bounds the size of its first set. At most
+          n_terminals.
+        max_body_length: maximum number of symbols after the first
+          terminal of a production (separators not counted).
+        nullable_ratio: fraction of non terminals with a lambda
+          production.
+        recursion_ratio: probability that a non terminal in a production
+          other than the first one refers back to N<j>, j <= i.
+        terminal_ratio: probability that a symbol after the first one is
+          a terminal.
+        n_terminals: number of terminals, separators apart. The LL(1)
+          table has a column for each one.
+        separators: number of separator terminals, which bounds the size
+          of the follow sets.
+
+    Returns:
+        LL(1) grammar.
+    """
+    if n_non_terminals < 1:
+        raise ValueError("At least one non terminal is needed.")
+    if separators < 1 and nullable_ratio > 0:
+        raise ValueError("Nullable non terminals need separators.")
+    if not 1 <= alternatives <= n_terminals:
+        raise ValueError("There must be between 1 and n_terminals alternatives.")
+    rng = random.Random(seed)
+    names = [f"N{i}" for i in range(n_non_terminals)]
+    nullable = [rng.random() < nullable_ratio for _ in names]
+    separator_names = [f";{k}" for k in range(separators)]
+
+    terminal_names = [f"t{k}" for k in range(n_terminals)]
+    productions: Dict[str, List[Tuple[str, ...]]] = {}
+    for i, nt in enumerate(names):
+        rhs = []
+        for j, first in enumerate(rng.sample(terminal_names, rng.randint(1, alternatives))):
+            body = [first]
+            forward = i + 1 < n_non_terminals
+            count = rng.randint(0, max_body_length)
+            if j == 0 and forward and max_body_length:
+                count = max(1, count)
+            for position in range(count):
+                backward = j > 0 and rng.random() < recursion_ratio
+                chain = j == 0 and position == 0 and forward # The first production always goes one level down
+                if not chain and (rng.random() < terminal_ratio or not (forward or backward)):
+                    body.append(rng.choice(terminal_names))
+                    continue
+                k = rng.randrange(i + 1) if backward else rng.randrange(i + 1, min(n_non_terminals, i + 1 + 2 * alternatives))
+                if j == 0 and not chain and not nullable[k]: # Keeps the shortest derivation linear in the depth
+                    body.append(rng.choice(terminal_names))
+                    continue
+                body.append(names[k])
+                if nullable[k]:
+                    body.append(rng.choice(separator_names)) # Never at the end of a body
+            rhs.append(tuple(body))
+        if nullable[i]:
+            rhs.append(())
+        productions[nt] = rhs
+    terminals = {s for rhs in productions.values() for body in rhs for s in body} - set(names) # Only the ones used
+    return Grammar(terminals, set(names), productions, names[0])
+
+
+class SentenceGenerator:
+    """
+    Random sentences of the language of an LL(1) table, built by walking
+    the table with an explicit stack, and near misses: sentences changed
+    in one token so that the table rejects them.
+
+    Args:
+        table: LL(1) table.
+        start: initial symbol.
+        seed: seed of the random generator.
+    """
+
+    def __init__(self, table: LL1Table, start: str, seed: Optional[int] = None) -> None:
+        self.table = table
+        self.start = start
+        self.rng = random.Random(seed)
+        self.compiled: CompiledLL1Table = table.compile()
+        self._terminals = sorted(t for t in table.terminals if t != "$")
+
+        self._bodies: Dict[str, List[Tuple[str, ...]]] = {} # Distinct bodies of every non terminal
+        for nt, row in table.cells.items():
+            self._bodies[nt] = list(dict.fromkeys(body for body in row.values() if body is not None))
+        self.min_length = self._min_lengths()
+        if start not in self.min_length:
+            raise ValueError(f"{start} derives no string.")
+        self._options: Dict[str, List[Tuple[int, Tuple[str, ...]]]] = {
+            nt: sorted((self._body_length(body), body) for body in bodies if self._body_length(body) is not None)
+            for nt, bodies in self._bodies.items() if nt in self.min_length
+        }
+
+    def _body_length(self, body: Sequence[str]) -> Optional[int]:
+        total = 0
+        for symbol in body:
+            if symbol in self._bodies:
+                if symbol not in self.min_length:
+                    return None
+                total += self.min_length[symbol]
+            else:
+                total += 1
+        return total
+
+    def _min_lengths(self) -> Dict[str, int]:
+        """
+        Length of the shortest string derived from every non terminal
+        (Knuth's generalization of Dijkstra's algorithm). Non terminals
+        that derive no string are left out.
+        """
+        users: Dict[str, List[int]] = {nt: [] for nt in self._bodies} # Productions that mention each non terminal
+        lhs: List[str] = []
+        missing: List[int] = [] # Non terminals of every production still unknown
+        partial: List[int] = [] # Length of every production with the known ones
+        heap: List[Tuple[int, str]] = []
+        for nt, bodies in self._bodies.items():
+            for body in bodies:
+                p = len(lhs)
+                lhs.append(nt)
+                missing.append(0)
+                partial.append(0)
+                for symbol in body:
+                    if symbol in self._bodies:
+                        users[symbol].append(p)
+                        missing[p] += 1
+                    else:
+                        partial[p] += 1
+                if not missing[p]:
+                    heapq.heappush(heap, (partial[p], nt))
+
+        lengths: Dict[str, int] = {}
+        while heap:
+            length, nt = heapq.heappop(heap)
+            if nt in lengths:
+                continue
+            lengths[nt] = length # The smallest candidate is final
+            for p in users[nt]:
+                partial[p] += length
+                missing[p] -= 1
+                if not missing[p] and lhs[p] not in lengths:
+                    heapq.heappush(heap, (partial[p], lhs[p]))
+        return lengths
+
+    def sentence(self, length: int) -> List[str]:
+        """
+        Random sentence, as long as the grammar allows up to about length
+        tokens. Sentences of non recursive grammars are bounded.
+
+        Args:
+            length: target number of tokens.
+
+        Returns:
+            Tokens of the sentence, followed by $.
+        """
+        rng = self.rng
+        options = self._options
+        min_length = self.min_length
+        out: List[str] = []
+        stack = [self.start]
+        pending = min_length[self.start] # Tokens that the stack must still produce
+        while stack:
+            top = stack.pop()
+            bodies = options.get(top)
+            if bodies is None: # Terminal
+                out.append(top)
+                pending -= 1
+                continue
+            pending -= min_length[top]
+            room = length - len(out) - pending # Tokens this expansion may produce
+            fitting = [option for option in bodies if option[0] <= room]
+            if not fitting:
+                size, body = bodies[0] # The shortest one
+            else:
+                growing = [option for option in fitting if any(s in options for s in option[1])]
+                size, body = rng.choice(growing or fitting)
+            pending += size
+            stack.extend(reversed(body))
+        out.append("$")
+        return out
+
+    def near_miss(self, length: int, attempts: int = 100) -> List[str]:
+        """
+        Sentence changed in one place (a token deleted, inserted, replaced
+        or swapped with the next one) so that the table rejects it.
+
+        Args:
+            length: target number of tokens of the original sentence.
+            attempts: changes to try before dropping the final $, which is
+              always wrong.
+
+        Returns:
+            Tokens of the incorrect input.
+        """
+        rng = self.rng
+        tokens = self.sentence(length)[:-1]
+        for _ in range(attempts):
+            wrong = list(tokens)
+            operation = rng.randrange(4)
+            position = rng.randrange(len(wrong) + 1)
+            if operation == 0 and wrong:
+                del wrong[min(position, len(wrong) - 1)]
+            elif operation == 1 or not wrong:
+                wrong.insert(position, rng.choice(self._terminals))
+            elif operation == 2:
+                wrong[min(position, len(wrong) - 1)] = rng.choice(self._terminals)
+            elif len(wrong) > 1:
+                k = min(position, len(wrong) - 2)
+                wrong[k], wrong[k + 1] = wrong[k + 1], wrong[k]
+            wrong.append("$")
+            if not self.compiled.recognize(wrong, self.start):
+                return wrong
+        return tokens
@@ -1,7 +1,73 @@
 from __future__ import annotations
 
-from collections import deque
-from typing import AbstractSet, Collection, MutableSet, Optional, Dict, List, Optional
+import gc
+import hashlib
+import json
+import os
+import threading
+import time
+from array import array
+from collections import Counter, OrderedDict, deque
+from multiprocessing import Pool
+from typing import AbstractSet, Any, Callable, Collection, Iterable, Iterator, Mapping, MutableSet, NamedTuple, Optional, Dict, List, Optional, Sequence, Tuple, Union
+
+class LL1Conflict(NamedTuple):
+    """
+    Conflict in an LL(1) table: several productions of a non terminal for
+    the same terminal. Its kind is FIRST/FIRST when the terminal starts all
+    of them and FIRST/FOLLOW when some of them get there through the
+    follow set of the non terminal.
+    """
+    non_terminal: str
+    terminal: str
+    productions: Tuple[Tuple[str, ...], ...]
+    kind: str
+
+    FIRST_FIRST = "FIRST/FIRST"
+    FIRST_FOLLOW = "FIRST/FOLLOW"
+
+
+class SemanticAction(NamedTuple):
+    """
+    Attribute rules of a production, for L-attributed evaluation.
+
+    synthesize(inherited, values) computes the synthesized attribute of the
+    left side from its inherited attribute and the attributes of the body
+    (the token itself for terminals). inherit(inherited, values), if given,
+    computes the inherited attribute of the next non terminal of the body
+    from the attributes of the symbols on its left; otherwise the inherited
+    attribute of the left side is copied.
+    """
+    synthesize: Callable[[Any, List[Any]], Any]
+    inherit: Optional[Callable[[Any, List[Any]], Any]] = None
+
+
+class PhaseStats(NamedTuple):
+    """
+    Measures of a phase of the analysis of a grammar, as given to the
+    observers registered with Grammar.add_observer.
+
+    Attributes:
+        phase: "first", "follow" or "table".
+        non_terminals: number of non terminals of the grammar.
+        productions: number of productions of the grammar.
+        seconds: wall time of the phase.
+        iterations: worklist evaluations (first), inclusion edges traversed
+          (follow) or productions placed (table).
+        unions: set unions (first and follow) or cells written (table).
+        peak_memory: peak of the memory allocated during the phase, in
+          bytes, if some observer asked for it. If tracemalloc was already
+          tracing, it is None when the phase stayed below the peak of that
+          session, which is not reset.
+    """
+    phase: str
+    non_terminals: int
+    productions: int
+    seconds: float
+    iterations: int
+    unions: int
+    peak_memory: Optional[int] = None
+
 
 class RepeatedCellError(Exception):
     """Exception for repeated cells in LL(1) tables."""
@@ -17,7 +83,9 @@ class Grammar:
         terminals: Terminal symbols of the grammar.
         non_terminals: Non terminal symbols of the grammar.
         productions: Dictionary with the production rules for each non terminal
-          symbol of the grammar.
+          symbol of the grammar. Every body is a sequence of symbols (a
+          string is a sequence of one character symbols) and is stored as a
+          tuple.
         axiom: Axiom of the grammar.
 
     """
@@ -26,7 +94,7 @@ class Grammar:
         self,
         terminals: AbstractSet[str],
         non_terminals: AbstractSet[str],
-        productions: Dict[str, List[str]],
+        productions: Dict[str, List[Sequence[str]]],
         axiom: str,
     ) -> None:
         if terminals & non_terminals:
@@ -62,9 +130,14 @@ class Grammar:
 
         self.terminals = terminals
         self.non_terminals = non_terminals
-        self.productions = productions
+        self.productions: Dict[str, List[Tuple[str, ...]]] = {nt: [tuple(body) for body in rhs] for nt, rhs in productions.items()}
         self.axiom = axiom
         self.follow = {nt:None for nt in non_terminals}
+        self._fingerprint: Optional[str] = None
+        self._analysis: Optional[GrammarAnalysis] = None # Shared with equal grammars through analysis_cache
+        self._private = False # Whether the analysis (and the productions) belong only to this grammar
+        self._occurrences: Optional[Dict[str, Counter]] = None # Index of (lhs, body, position) of every non terminal, for edits
+        self.actions: Dict[Tuple[str, Tuple[str, ...]], SemanticAction] = {} # Attribute rules of (lhs, body)
 
     def __repr__(self) -> str:
         return (
@@ -76,53 +149,271 @@ class Grammar:
         )
 
 
-    def compute_first(self, sentence: str) -> AbstractSet[str]:
+    @staticmethod
+    def add_observer(observer: Callable[[PhaseStats], None], trace_memory: bool = False) -> None:
+        """
+        Registers a function called with the PhaseStats of every phase of
+        the analysis of any grammar. Nothing is measured while there are no
+        observers.
+
+        Args:
+            observer: function to call.
+            trace_memory: whether to measure the peak memory of the phases
+              with tracemalloc, which makes them several times slower.
+        """
+        global _observers
+        with _observers_lock:
+            _observers = _observers + ((observer, trace_memory),) # Replaced, never changed, so phases read it without the lock
+
+    @staticmethod
+    def remove_observer(observer: Callable[[PhaseStats], None]) -> None:
+        """
+        Unregisters an observer added with add_observer.
+
+        Args:
+            observer: function to remove.
+
+        Raises:
+            ValueError: if the observer is not registered.
+        """
+        global _observers
+        with _observers_lock:
+            for i, (registered, _) in enumerate(_observers):
+                if registered == observer: # Bound methods are equal, not identical
+                    _observers = _observers[:i] + _observers[i + 1:]
+                    return
+        raise ValueError("Observer not registered.")
+
+    def _run_phase(self, phase: str, compute: Callable[[], Tuple[int, int]]) -> None:
+        """
+        Runs a phase of the analysis, measuring it if there are observers.
+
+        Args:
+            phase: name of the phase.
+            compute: body of the phase, returning its iteration and union
+              counts.
+        """
+        observers = _observers
+        if not observers: # The only cost when disabled
+            compute()
+            return
+
+        trace_memory = any(memory for _, memory in observers)
+        started = False # Whether tracing was started here, and so must be stopped here
+        if trace_memory:
+            import tracemalloc
+
+            started = not tracemalloc.is_tracing()
+            if started:
+                tracemalloc.start()
+            base, earlier_peak = tracemalloc.get_traced_memory() # The peak of someone else's session is left alone
+        try:
+            start = time.perf_counter()
+            iterations, unions = compute()
+            seconds = time.perf_counter() - start
+            peak: Optional[int] = None
+            if trace_memory:
+                session_peak = tracemalloc.get_traced_memory()[1]
+                if started or session_peak > earlier_peak: # Otherwise the peak may come from before the phase
+                    peak = session_peak - base
+        finally:
+            if started:
+                tracemalloc.stop()
+
+        stats = PhaseStats(
+            phase,
+            len(self.non_terminals),
+            sum(map(len, self.productions.values())),
+            seconds,
+            iterations,
+            unions,
+            peak,
+        )
+        for observer, _ in observers:
+            observer(stats)
+
+    def _get_analysis(self) -> GrammarAnalysis:
+        if self._analysis is None: # Look for an equal grammar analyzed before
+            self._analysis = analysis_cache.get(self.fingerprint())
+        return self._analysis
+
+    def _compute_first_sets(self) -> None:
+        """
+        Computes the nullable set and the first set of every non terminal in
+        a single worklist fixpoint. Results are cached in the analysis of the
+        grammar.
+        """
+        self._run_phase("first", self._first_sets)
+
+    def _first_sets(self) -> Tuple[int, int]:
+        """
+        Body of the first phase.
+
+        Returns:
+            Number of worklist evaluations and of set unions.
+        """
+        nullable: set[str] = set() # Non terminals that derive lambda
+        first: Dict[str, set[str]] = {nt: set() for nt in self.non_terminals} # First sets (without lambda)
+        users: Dict[str, set[str]] = {nt: set() for nt in self.non_terminals} # Non terminals whose productions mention each key
+
+        for nt, rhs in self.productions.items(): # Single scan to find who depends on whom
+            for body in rhs:
+                for s in body:
+                    if s in users:
+                        users[s].add(nt)
+
+        pending = deque(self.non_terminals) # Worklist of non terminals to (re)evaluate
+        queued = set(self.non_terminals) # Mirror of the worklist for O(1) membership
+
+        iterations = unions = 0 # Plain counters, for the phase observers
+        while pending:
+            nt = pending.popleft()
+            iterations += 1
+            queued.discard(nt)
+            nt_first = first[nt]
+            old_size = len(nt_first)
+            was_nullable = nt in nullable
+            for body in self.productions[nt]: # Every production contributes the first of its body
+                for s in body:
+                    if s not in first: # Terminal: it starts the body and ends the scan
+                        nt_first.add(s)
+                        break
+                    nt_first |= first[s]
+                    unions += 1
+                    if s not in nullable: # Only a nullable prefix lets the next symbol contribute
+                        break
+                else: # The whole body can derive lambda
+                    nullable.add(nt)
+            if len(nt_first) != old_size or (nt in nullable) != was_nullable: # Something grew: wake up the dependents
+                for user in users[nt]:
+                    if user not in queued:
+                        queued.add(user)
+                        pending.append(user)
+
+        analysis = self._get_analysis()
+        analysis.nullable = nullable
+        analysis.first = first
+        return iterations, unions
+
+    def compute_first(self, sentence: Sequence[str]) -> AbstractSet[str]:
         """
         Method to compute the first set of a string.
 
         Args:
-            str: string whose first set is to be computed.
+            str: string whose first set is to be computed, or sequence of
+              symbols if some of them have more than one character.
 
         Returns:
             First set of str.
         """
-        firstElems: set[str] = set() # Set of first elements to be returned
-
-        if sentence == '': # Special preventive case: if the sentence is void, it is always only started by lambda
-            firstElems.add('')
-            return firstElems
-        
         for i in sentence: # Quick check, all elements in the string must be valid 
             if i not in self.terminals and i not in self.non_terminals:
                 raise ValueError() # Error! invalid value in string
 
-        voidFlag = True # Flag that indicates if lambda is a valid first element
-        to_check = deque(sentence) # Queue of elements to check
-        checked = set() # Set of checked elements to prevent endless looping
-
-        while to_check and voidFlag is True: # Outer loop: run until lambda is not on the possible firsts or you reach end of chain
-            voidFlag = False # Set it back to false
-            current_char = to_check.popleft() # Get next element
-            if current_char in self.terminals: # If the element is a terminal, add to list and carry on
-                firstElems.add(current_char)
-                break
-            checked.add(current_char) # Otherwise add to checked elements and move on
-            for case in self.productions[current_char]: # Loop through all possibilities of the first element
-                if case == '': # If its lambda, set void to true
-                    voidFlag = True
-                elif case[0] in self.terminals: # Add to list if its terminal
-                    firstElems.add(case[0])
-                else: # Otherwise it's a non-terminal, add and explore
-                    for i in case:
-                        if i not in checked:
-                            to_check.append(i)
-                    voidFlag = True
-        if voidFlag is True: # If the chain ends and lambda is still valid, add as posible first
-            firstElems.add('')
+        analysis = self._get_analysis()
+        if analysis.first is None: # Sets for every non terminal are computed only once
+            self._compute_first_sets()
+        first = analysis.first
+        nullable = analysis.nullable
+
+        firstElems: set[str] = set() # Set of first elements to be returned
+        for s in sentence: # Compose the cached sets until a non nullable symbol is found
+            if s not in first: # Terminal: nothing after it can start the sentence
+                firstElems.add(s)
+                return firstElems
+            firstElems |= first[s]
+            if s not in nullable:
+                return firstElems
+        firstElems.add('') # Every symbol (or none at all) can derive lambda
 
         return firstElems
-	
 
+    def _compute_follow_sets(self) -> None:
+        """
+        Computes the follow set of every non terminal. A single scan of the
+        productions yields the terminals directly following each occurrence
+        of a non terminal and the inclusion graph Follow(X) ⊇ Follow(A),
+        which is then resolved collapsing its strongly connected components
+        (DeRemer-Pennello digraph algorithm). Results are stored in
+        self.follow.
+        """
+        if self._get_analysis().first is None: # Before the follow phase starts, so it is timed apart
+            self._compute_first_sets()
+        self._run_phase("follow", self._follow_sets)
+
+    def _follow_sets(self) -> Tuple[int, int]:
+        """
+        Body of the follow phase.
+
+        Returns:
+            Number of inclusion edges traversed and of set unions.
+        """
+        analysis = self._get_analysis()
+        first = analysis.first
+        nullable = analysis.nullable
+
+        followDict: Dict[str, set[str]] = {nt: set() for nt in self.non_terminals} # Starts with the directly following terminals
+        includes: Dict[str, set[str]] = {nt: set() for nt in self.non_terminals} # X -> {A : Follow(X) ⊇ Follow(A)}
+        followDict[self.axiom].add('$') # The axiom is followed by the end of the chain
+
+        unions = 0
+        for key, prod_list in self.productions.items(): # Single scan: every occurrence of every symbol is visited once
+            for prod in prod_list:
+                suffix_first: set[str] = set() # First of the part of the body right of the current position
+                suffix_nullable = True # Whether that part can derive lambda
+                for s in reversed(prod):
+                    if s in first: # Only non terminals have follow sets
+                        followDict[s] |= suffix_first
+                        unions += 1
+                        if suffix_nullable and s != key: # Follow(key) ⊆ Follow(s), trivial when s == key
+                            includes[s].add(key)
+                        if s in nullable:
+                            suffix_first = suffix_first | first[s]
+                        else:
+                            suffix_first = first[s]
+                            suffix_nullable = False
+                    else:
+                        suffix_first = {s}
+                        suffix_nullable = False
+
+        # Digraph traversal, with an explicit call stack to stay clear of the recursion limit
+        done = len(self.non_terminals) + 1 # Depth marking a node whose component is finished
+        depth = dict.fromkeys(self.non_terminals, 0) # 0 means not visited yet
+        path: List[str] = [] # Tarjan stack of the nodes in unfinished components
+        for root in self.non_terminals:
+            if depth[root]:
+                continue
+            path.append(root)
+            depth[root] = len(path)
+            calls = [(root, iter(includes[root]), len(path))] # Frames of (node, pending successors, entry depth)
+            while calls:
+                node, successors, entry = calls[-1]
+                for succ in successors:
+                    if not depth[succ]: # Descend into an unvisited successor
+                        path.append(succ)
+                        depth[succ] = len(path)
+                        calls.append((succ, iter(includes[succ]), len(path)))
+                        break
+                    depth[node] = min(depth[node], depth[succ])
+                    followDict[node] |= followDict[succ]
+                else: # All successors visited: return from node
+                    calls.pop()
+                    if depth[node] == entry: # Node is the root of a component: every member gets its set
+                        while True:
+                            member = path.pop()
+                            depth[member] = done
+                            if member == node:
+                                break
+                            followDict[member] = set(followDict[node])
+                    if calls: # Propagate to the caller as the recursive version would
+                        caller = calls[-1][0]
+                        depth[caller] = min(depth[caller], depth[node])
+                        followDict[caller] |= followDict[node]
+
+        analysis.follow = followDict
+        self.follow = followDict
+        edges = sum(map(len, includes.values())) # Each one is traversed once, with one union
+        return edges, unions + edges
 
     def compute_follow(self, symbol: str) -> AbstractSet[str]:
         """
@@ -134,81 +425,647 @@ class Grammar:
         Returns:
             Follow set of symbol.
         """
-        if symbol == '': # Special case: void strings cannot be worked with
-            raise ValueError() # Error! Grammar cannot compute the follow of a void string
-        
-        for i in symbol: # Quick check that all elements are valid for this grammar
-            if i not in self.terminals and i not in self.non_terminals:
-                raise ValueError() # Error! invalid value in string
+        if symbol not in self.non_terminals: # Only non terminals have a follow set
+            raise ValueError() # Error! invalid value for this grammar
 
-        if self.follow[symbol[-1]] is not None: # General case after determining the follows to avoid costly repetition of the operation
-            return self.follow[symbol[-1]]  # Simply accesses the stored following symbols for the string
-    
-        # Otherwise, it's the first time they're being requested, and we go on to determine them
-        followDict = {nt:set() for nt in self.non_terminals} # Dictionary of following symbols by nonterminal (we MUST do it like this to avoid infinite loops)
-        followDict[self.axiom].add('$') # Adds the basic rule where the axiom is followed by the end of the chain
-        changeflag = True
-
-        while changeflag is True: # While there are changes being made compared to the last step, loop
-            changeflag = False # Set the flag off
-            for term in self.non_terminals: # First iterator: go over every grammatic non terminal element
-                for key in self.productions: # Second iterator: run through all productions
-                    prod_list = self.productions[key] # Get the content of the productions
-                    if term != key: # Ignore the list of productions for that same term
-                        for prod in prod_list: # Iterate over the productions for each key...
-                            if term in prod: # Only if the term we're iterating for is in said production
-                                position = prod.find(term) # Get the position of the term in the production
-                                if position == len(prod)-1: # Case where term is at the end of the production
-                                    if not followDict[term].issuperset(followDict[key]): # Only add and change if it has new elements (ie, is not superset)
-                                        followDict[term].update(followDict[key]) # Assign as follow whatever follows the producer term
-                                        changeflag = True # Set as true because changes were made. This applies for the two other rules below
-                                else: # Case where it is followed by something else within the production
-                                    addy = self.compute_first(prod[position+1]) # Get the set of first elements from the next term
-                                    if '' in addy and position == len(prod)-2: # If that is the final term AND can be lambda...
-                                        if not followDict[term].issuperset(followDict[key]):
-                                            followDict[term].update(followDict[key]) # Then also add whatever follows the producer
-                                            changeflag = True
-                                    updated_elements = addy - {''}
-                                    if not followDict[term].issuperset(updated_elements):
-                                        followDict[term].update(updated_elements) # Add from the first elements
-                                        changeflag = True
+        if self.follow[symbol] is None: # The whole graph is resolved the first time any follow is requested
+            analysis = self._get_analysis()
+            if analysis.follow is None:
+                self._compute_follow_sets()
+            self.follow = analysis.follow
+        return self.follow[symbol]
 
-        
-        self.follow = followDict # Assign the newly produced dictionary to avoid repeating this huge loop again and return it
-        return followDict[symbol[-1]]
-        
     def get_ll1_table(self) -> Optional[LL1Table]:
         """
-        Method to compute the LL(1) table.
+        Method to compute the LL(1) table. The table is shared with every
+        equal grammar, so it should not be modified. It is a snapshot:
+        later edits of the grammar (add_production, remove_production)
+        work on a copy.
 
         Returns:
             LL(1) table for the grammar, or None if the grammar is not LL(1).
         """
-        firsts = {nt:self.compute_first(nt) for nt in self.non_terminals} # Set up a dictionary for the first elements
-        ltable = LL1Table(self.non_terminals,self.terminals.union('$')) # Prepares the bones of the table with the elements
-
-        for elem in self.non_terminals: # Outer loop: run through the elements to fill out the table
-            for item in firsts[elem]: # First rule: For every first, put the production that matches it
-                if item != '': # For the normal case where it isn't lambda
-                    prods = self.productions[elem] # Get all productions
-                    for i in prods: # Runs through every production for that non terminal
-                        if item in self.compute_first(i): # Checks if the first element is a first for i
-                            if ltable.cells[elem][item] == None: # Make sure the cell is empty
-                                ltable.cells[elem][item] = i # Assigns the production to the empty cell
-                            else: # There is no break to make sure no other production has the same first element
-                                return None # If the cell isn't empty, there is ambiguity, and it isn't LL(1)!
-                else: # The case where it is lambda: get the following elements and set those to lambda
-                    for follow in self.compute_follow(elem): # Gets the set of following elements, should only compute once
-                        if ltable.cells[elem][follow] == None: # Make sure the cell is empty
-                            ltable.cells[elem][follow] = '' # Assigns lambda to the empty cell
-                        else: # If the cell was already full, we do as in the other case
-                            return None # If the cell isn't empty, there is ambiguity, and it isn't LL(1)!
-        
-        return ltable # If it managed to finish the table, there were no cases of ambiguity, and it is LL(1)
+        table = self._ll1_table()
+        if table is not None:
+            self._analysis.handed_out = True
+        return table
+
+    def _ll1_table(self) -> Optional[LL1Table]:
+        """LL(1) table for internal use, which later edits may change in place."""
+        analysis = self._get_analysis()
+        if analysis.table is _NOT_COMPUTED:
+            analysis.table = self._build_ll1_table()
+        return analysis.table
+
+    def get_compiled_ll1_table(self) -> Optional[CompiledLL1Table]:
+        """
+        Method to get the compiled LL(1) table, shared with every equal
+        grammar.
+
+        Returns:
+            Compiled LL(1) table for the grammar, or None if the grammar is
+            not LL(1).
+        """
+        analysis = self._get_analysis()
+        if analysis.compiled is _NOT_COMPUTED:
+            table = self._ll1_table() # The compiled table is a snapshot already
+            analysis.compiled = None if table is None else table.compile()
+        return analysis.compiled
+
+    def _build_row(self, elem: str, row: Dict[str, Optional[Tuple[str, ...]]]) -> bool:
+        """
+        Fills the row of a non terminal in an LL(1) table, keeping the first
+        production written to every cell.
+
+        Returns:
+            True if two productions collide in some cell of the row.
+        """
+        for t in row: # The row is rebuilt from scratch
+            row[t] = None
+        conflict = False
+        for i in self.productions[elem]:
+            body_first = self.compute_first(i) # Composed from the cached sets, linear in the body length
+            for item in body_first: # First rule: the production goes under every terminal that starts it
+                if item != '':
+                    if row[item] is None: # Make sure the cell is empty
+                        row[item] = i
+                    else:
+                        conflict = True # If the cell isn't empty, there is ambiguity, and it isn't LL(1)!
+            if '' in body_first: # Second rule: a nullable body goes under every follow of the non terminal
+                for follow in self.compute_follow(elem):
+                    if follow in body_first: # Already placed (or collided) by the first rule: not a conflict with itself
+                        continue
+                    if row[follow] is None:
+                        row[follow] = i
+                    else:
+                        conflict = True
+        return conflict
+
+    def _build_ll1_table(self) -> Optional[LL1Table]:
+        analysis = self._get_analysis()
+        if analysis.follow is None: # Before the table phase starts, so every phase is timed apart
+            self._compute_follow_sets()
+        self._run_phase("table", self._fill_ll1_table)
+        return None if analysis.conflicts else analysis.partial_table # If there were no cases of ambiguity, it is LL(1)
+
+    def _fill_ll1_table(self) -> Tuple[int, int]:
+        """
+        Body of the table phase.
+
+        Returns:
+            Number of productions placed and of cells written.
+        """
+        ltable = LL1Table(set(self.non_terminals),self.terminals.union('$')) # Prepares the bones of the table with the elements
+        conflicts = {elem for elem in self.productions if self._build_row(elem, ltable.cells[elem])} # Every production is visited exactly once
+
+        analysis = self._get_analysis()
+        analysis.partial_table = ltable # Kept whole, so that edits can update it row by row
+        analysis.conflicts = conflicts
+        if not _observers:
+            return 0, 0
+        productions = sum(map(len, self.productions.values()))
+        cells = sum(body is not None for row in ltable.cells.values() for body in row.values())
+        return productions, cells
+
+    def get_ll1_conflicts(self) -> Tuple[LL1Table, List[LL1Conflict]]:
+        """
+        Method to compute the LL(1) table and every conflict in it, in a
+        single pass.
+
+        Returns:
+            Partial LL(1) table, where conflicting cells keep the first
+            production found, and the list of conflicts sorted by non
+            terminal and terminal (empty if the grammar is LL(1)). The table
+            is shared with every equal grammar, so it should not be
+            modified. Like the one of get_ll1_table, it is a snapshot.
+        """
+        self._ll1_table()
+        analysis = self._analysis
+        analysis.handed_out = True
+
+        conflicts: List[LL1Conflict] = []
+        for elem in sorted(analysis.conflicts): # Only rows known to collide are looked at again
+            entries: Dict[str, List[Tuple[str, bool]]] = {} # Terminal -> [(body, entered by follow)]
+            for i in self.productions[elem]:
+                body_first = self.compute_first(i)
+                for item in body_first:
+                    if item != '':
+                        entries.setdefault(item, []).append((i, False))
+                if '' in body_first:
+                    for follow in self.compute_follow(elem):
+                        if follow not in body_first: # Every production is listed once per cell
+                            entries.setdefault(follow, []).append((i, True))
+            for t in sorted(entries):
+                if len(entries[t]) > 1:
+                    conflicts.append(LL1Conflict(
+                        elem,
+                        t,
+                        tuple(body for body, _ in entries[t]),
+                        LL1Conflict.FIRST_FOLLOW if any(by_follow for _, by_follow in entries[t]) else LL1Conflict.FIRST_FIRST,
+                    ))
+        return analysis.partial_table, conflicts
+
+    def add_production(self, non_terminal: str, body: Sequence[str]) -> None:
+        """
+        Adds a production to the grammar, updating the nullable set, first
+        and follow sets and LL(1) table already computed only where they
+        can change.
+
+        Args:
+            non_terminal: left side of the production. It may be a new non
+              terminal symbol.
+            body: right side of the production.
+        """
+        body = tuple(body)
+        if non_terminal in self.terminals or non_terminal == '':
+            raise ValueError(
+                f"Invalid non terminal symbol {non_terminal}.",
+            )
+        for s in body:
+            if (
+                s not in self.non_terminals
+                and s not in self.terminals
+                and s != non_terminal
+            ):
+                raise ValueError(
+                    f"Invalid symbol {s}.",
+                )
+
+        analysis = self._detach_analysis()
+        occurrences = self._get_occurrences()
+        if non_terminal not in self.non_terminals: # New row for every computed structure
+            self.non_terminals.add(non_terminal)
+            self.productions[non_terminal] = []
+            occurrences[non_terminal] = Counter()
+            if analysis.first is not None:
+                analysis.first[non_terminal] = set()
+            self.follow[non_terminal] = set() if analysis.follow is not None else None
+            if analysis.partial_table is not None:
+                analysis.partial_table.non_terminals.add(non_terminal)
+                analysis.partial_table.cells[non_terminal] = dict.fromkeys(analysis.partial_table.terminals)
+
+        self.productions[non_terminal].append(body)
+        for pos, s in enumerate(body):
+            if s in occurrences:
+                occurrences[s][(non_terminal, body, pos)] += 1
+        self._update_after_edit(non_terminal, body, added=True)
+
+    def remove_production(self, non_terminal: str, body: Sequence[str]) -> None:
+        """
+        Removes a production from the grammar, updating the nullable set,
+        first and follow sets and LL(1) table already computed only where
+        they can change.
+
+        Args:
+            non_terminal: left side of the production.
+            body: right side of the production.
+        """
+        body = tuple(body)
+        if body not in self.productions.get(non_terminal, ()):
+            raise ValueError(
+                f"No production {non_terminal} -> {body}.",
+            )
+        if len(self.productions[non_terminal]) == 1:
+            raise ValueError(
+                f"No production rules would be left for non terminal symbol {non_terminal}.",
+            )
 
+        self._detach_analysis()
+        occurrences = self._get_occurrences()
+        self.productions[non_terminal].remove(body)
+        if body not in self.productions[non_terminal]:
+            self.actions.pop((non_terminal, body), None)
+        for pos, s in enumerate(body):
+            if s in occurrences:
+                counter = occurrences[s]
+                key = (non_terminal, body, pos)
+                counter[key] -= 1
+                if not counter[key]:
+                    del counter[key]
+        self._update_after_edit(non_terminal, body, added=False)
+
+    def set_action(
+        self,
+        non_terminal: str,
+        body: Sequence[str],
+        synthesize: Callable[[Any, List[Any]], Any],
+        inherit: Optional[Callable[[Any, List[Any]], Any]] = None,
+    ) -> None:
+        """
+        Attaches attribute rules to a production (see SemanticAction).
+        Productions without rules synthesize None.
+
+        Args:
+            non_terminal: left side of the production.
+            body: right side of the production.
+            synthesize: rule for the synthesized attribute of the left side.
+            inherit: rule for the inherited attribute of the non terminals
+              of the body.
+        """
+        body = tuple(body)
+        if body not in self.productions.get(non_terminal, ()):
+            raise ValueError(
+                f"No production {non_terminal} -> {body}.",
+            )
+        self.actions[(non_terminal, body)] = SemanticAction(synthesize, inherit)
+
+    def evaluate(self, input_string: Iterable[str], inherited: Any = None) -> Any:
+        """
+        Analyzes a string from the axiom, evaluating the attribute rules of
+        the productions on the fly (see LL1Table.evaluate).
+
+        Args:
+            input_string: string or sequence of terminal names to analyze.
+            inherited: inherited attribute of the axiom.
+
+        Returns:
+            Synthesized attribute of the axiom.
+
+        Raises:
+            ValueError: if the grammar is not LL(1).
+            SyntaxError: if the input string is not syntactically correct.
+        """
+        table = self._ll1_table()
+        if table is None:
+            raise ValueError("The grammar is not LL(1).")
+        return table.evaluate(input_string, self.axiom, self.actions, inherited)
+
+    def _detach_analysis(self) -> GrammarAnalysis:
+        """
+        Makes the grammar and its analysis private before an edit, copying
+        whatever was already computed, so equal grammars are not affected.
+        """
+        self._fingerprint = None
+        if self._private:
+            analysis = self._analysis
+            if analysis.handed_out and analysis.partial_table is not None: # Tables returned before stay as they were
+                analysis.partial_table = analysis.partial_table.copy()
+                analysis.table = None if analysis.conflicts else analysis.partial_table
+            analysis.handed_out = False
+            return analysis
+
+        self.non_terminals = set(self.non_terminals)
+        self.productions = {nt: list(rhs) for nt, rhs in self.productions.items()}
+        shared = self._analysis
+        analysis = GrammarAnalysis()
+        if shared is not None:
+            if shared.first is not None:
+                analysis.nullable = set(shared.nullable)
+                analysis.first = {nt: set(f) for nt, f in shared.first.items()}
+            if shared.follow is not None:
+                analysis.follow = {nt: set(f) for nt, f in shared.follow.items()}
+            if shared.partial_table is not None:
+                table = shared.partial_table.copy()
+                analysis.partial_table = table
+                analysis.conflicts = set(shared.conflicts)
+                analysis.table = None if analysis.conflicts else table
+        self._analysis = analysis
+        self._private = True
+        self.follow = analysis.follow if analysis.follow is not None else {nt: None for nt in self.non_terminals}
+        return analysis
+
+    def _get_occurrences(self) -> Dict[str, Counter]:
+        if self._occurrences is None:
+            occurrences: Dict[str, Counter] = {nt: Counter() for nt in self.non_terminals}
+            for lhs, rhs in self.productions.items():
+                for body in rhs:
+                    for pos, s in enumerate(body):
+                        if s in occurrences:
+                            occurrences[s][(lhs, body, pos)] += 1
+            self._occurrences = occurrences
+        return self._occurrences
+
+    def _first_of(self, sentence: Sequence[str]) -> Tuple[set[str], bool]:
+        """First set (without lambda) of a sentence and whether it is nullable, from the cached sets."""
+        first = self._analysis.first
+        nullable = self._analysis.nullable
+        result: set[str] = set()
+        for s in sentence:
+            if s not in first:
+                result.add(s)
+                return result, False
+            result |= first[s]
+            if s not in nullable:
+                return result, False
+        return result, True
+
+    def _update_after_edit(self, non_terminal: str, body: Tuple[str, ...], added: bool) -> None:
+        """
+        Brings the computed analysis up to date after adding or removing the
+        production non_terminal -> body, which is already applied to
+        self.productions.
+        """
+        analysis = self._analysis
+        analysis.compiled = _NOT_COMPUTED
+        if analysis.partial_table is not None: # Its rows are rebuilt in place below
+            analysis.partial_table.invalidate()
+        if analysis.first is None: # Nothing computed yet: it will be computed when needed
+            return
+
+        nullable = analysis.nullable
+        first = analysis.first
+        occurrences = self._occurrences
+
+        lost_nullable: set[str] = set() # Non terminals that stopped being nullable
+        if added: # Sets can only grow: propagate from the edited non terminal
+            changed = self._first_fixpoint([non_terminal], None)
+        else: # Sets can shrink: recompute everything whose first depends on the edited non terminal
+            region = {non_terminal}
+            pending = [non_terminal]
+            while pending:
+                x = pending.pop()
+                for lhs, prod, pos in occurrences[x]:
+                    if lhs not in region and all(s in nullable for s in prod[:pos]):
+                        region.add(lhs)
+                        pending.append(lhs)
+            old_first = {x: first[x] for x in region}
+            old_nullable = region & nullable
+            for x in region:
+                first[x] = set()
+            nullable -= region
+            self._first_fixpoint(region, region)
+            lost_nullable = old_nullable - nullable
+            changed = {x for x in region if first[x] != old_first[x] or x in lost_nullable}
+
+        rows = {non_terminal} | changed # Rows of the table that must be rebuilt
+        for x in changed:
+            for lhs, _, _ in occurrences[x]:
+                rows.add(lhs)
+
+        if analysis.follow is not None:
+            seeds = {s for s in body if s in first} # Follow constraints changed around the edited body...
+            for x in changed: # ...and before every occurrence of a non terminal whose first changed
+                for _, prod, pos in occurrences[x]:
+                    seeds.update(s for s in prod[:pos] if s in first)
+            rows |= self._update_follow(seeds, lost_nullable)
+
+        table = analysis.partial_table
+        if table is not None:
+            for elem in rows:
+                if self._build_row(elem, table.cells[elem]):
+                    analysis.conflicts.add(elem)
+                else:
+                    analysis.conflicts.discard(elem)
+            analysis.table = None if analysis.conflicts else table
+
+    def _first_fixpoint(self, pending: Iterable[str], region: Optional[AbstractSet[str]]) -> set[str]:
+        """
+        Worklist fixpoint over the first sets starting from some non
+        terminals, waking up only those inside region (all if None).
+
+        Returns:
+            Non terminals whose first set or nullability grew.
+        """
+        nullable = self._analysis.nullable
+        first = self._analysis.first
+        occurrences = self._occurrences
+        queue = deque(pending)
+        queued = set(queue)
+        grown: set[str] = set()
+
+        while queue:
+            nt = queue.popleft()
+            queued.discard(nt)
+            nt_first = first[nt]
+            old_size = len(nt_first)
+            was_nullable = nt in nullable
+            for body in self.productions[nt]:
+                for s in body:
+                    if s not in first:
+                        nt_first.add(s)
+                        break
+                    nt_first |= first[s]
+                    if s not in nullable:
+                        break
+                else:
+                    nullable.add(nt)
+            if len(nt_first) != old_size or (nt in nullable) != was_nullable:
+                grown.add(nt)
+                for user, _, _ in occurrences[nt]:
+                    if user not in queued and (region is None or user in region):
+                        queued.add(user)
+                        queue.append(user)
+        return grown
+
+    def _update_follow(self, seeds: AbstractSet[str], lost_nullable: AbstractSet[str]) -> set[str]:
+        """
+        Recomputes the follow sets of some non terminals and of every non
+        terminal whose follow includes theirs.
+
+        Args:
+            seeds: non terminals whose own follow constraints changed.
+            lost_nullable: non terminals that stopped being nullable, still
+              considered nullable when looking for inclusions.
+
+        Returns:
+            Non terminals whose follow set changed.
+        """
+        follow = self._analysis.follow
+        nullable = self._analysis.nullable
+        occurrences = self._occurrences
+
+        region = set(seeds) # Closure along Follow(Y) ⊆ Follow(Z), old and new inclusions alike
+        pending = list(seeds)
+        while pending:
+            y = pending.pop()
+            for prod in self.productions[y]:
+                for s in reversed(prod):
+                    if s in follow and s not in region:
+                        region.add(s)
+                        pending.append(s)
+                    if s not in nullable and s not in lost_nullable:
+                        break
+
+        old_follow = {z: follow[z] for z in region}
+        includes: Dict[str, List[str]] = {z: [] for z in region} # Y -> [Z in region : Follow(Z) ⊇ Follow(Y)]
+        for z in region:
+            z_follow = {'$'} if z == self.axiom else set()
+            for lhs, prod, pos in occurrences[z]:
+                rest_first, rest_nullable = self._first_of(prod[pos + 1:])
+                z_follow |= rest_first
+                if rest_nullable and lhs != z:
+                    if lhs in region:
+                        includes[lhs].append(z)
+                    else: # Outside the region the follow is already final
+                        z_follow |= follow[lhs]
+            follow[z] = z_follow
+
+        pending = list(region)
+        while pending:
+            y = pending.pop()
+            for z in includes[y]:
+                if not follow[y] <= follow[z]:
+                    follow[z] |= follow[y]
+                    pending.append(z)
+
+        return {z for z in region if follow[z] != old_follow[z]}
 
     def is_ll1(self) -> bool:
-        return self.get_ll1_table() is not None
+        return self._ll1_table() is not None
+
+    def fingerprint(self) -> str:
+        """
+        Canonical fingerprint of the grammar: equal for grammars with the same
+        terminals, non terminals, axiom and productions, whatever the order
+        in which they were given.
+
+        Returns:
+            Hexadecimal SHA-256 digest.
+        """
+        if self._fingerprint is None:
+            canonical = [
+                sorted(self.terminals),
+                sorted(self.non_terminals),
+                self.axiom,
+                [[nt, sorted(list(body) for body in self.productions[nt])] for nt in sorted(self.productions)],
+            ]
+            self._fingerprint = hashlib.sha256(json.dumps(canonical, ensure_ascii=False).encode()).hexdigest()
+        return self._fingerprint
+
+
+_NOT_COMPUTED = object() # Marks analysis results not computed yet (None means "not LL(1)")
+
+
+class GrammarAnalysis:
+    """
+    Results of the analysis of a grammar: nullable set, first and follow
+    sets of the non terminals, LL(1) table and its compiled form. Every
+    part is filled the first time it is needed.
+    """
+
+    def __init__(self) -> None:
+        self.nullable: Optional[set[str]] = None
+        self.first: Optional[Dict[str, set[str]]] = None
+        self.follow: Optional[Dict[str, set[str]]] = None
+        self.table: object = _NOT_COMPUTED
+        self.compiled: object = _NOT_COMPUTED
+        self.partial_table: Optional[LL1Table] = None # Table including conflicting rows
+        self.handed_out = False # Whether the table was returned to a caller, and so must be copied before an edit
+        self.conflicts: set[str] = set() # Non terminals whose row has a conflict
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class AnalysisCache:
+    """
+    Process-wide LRU cache of grammar analyses, keyed by grammar
+    fingerprint, so that equal grammars built separately are analyzed only
+    once.
+
+    Args:
+        maxsize: maximum number of analyses kept.
+
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, GrammarAnalysis] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, fingerprint: str) -> GrammarAnalysis:
+        """
+        Returns the analysis for a fingerprint, creating an empty one (and
+        evicting the least recently used one if full) on a miss.
+        """
+        with self._lock:
+            analysis = self._entries.get(fingerprint)
+            if analysis is not None:
+                self.hits += 1
+                self._entries.move_to_end(fingerprint)
+                return analysis
+            self.misses += 1
+            analysis = GrammarAnalysis()
+            self._entries[fingerprint] = analysis
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return analysis
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+analysis_cache = AnalysisCache()
+
+_observers: Tuple[Tuple[Callable[[PhaseStats], None], bool], ...] = () # (observer, trace_memory) pairs
+_observers_lock = threading.Lock()
+
+
+class PhaseRecorder:
+    """
+    Phase observer that keeps the PhaseStats of every phase, to export them
+    as JSON. As a context manager it is registered on entry and removed on
+    exit::
+
+        with PhaseRecorder() as recorder:
+            grammar.get_ll1_table()
+        print(recorder.to_json())
+
+    Args:
+        trace_memory: whether to measure the peak memory of the phases.
+    """
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        self.trace_memory = trace_memory
+        self.records: List[PhaseStats] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, stats: PhaseStats) -> None:
+        with self._lock:
+            self.records.append(stats)
+
+    def __enter__(self) -> PhaseRecorder:
+        Grammar.add_observer(self, self.trace_memory)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        Grammar.remove_observer(self)
+
+    def totals(self) -> Dict[str, Dict[str, float]]:
+        """
+        Sums of the measures of every phase.
+
+        Returns:
+            Dictionary from phase name to its count of runs, seconds,
+            iterations and unions.
+        """
+        totals: Dict[str, Dict[str, float]] = {}
+        with self._lock:
+            for stats in self.records:
+                total = totals.setdefault(stats.phase, {"runs": 0, "seconds": 0.0, "iterations": 0, "unions": 0})
+                total["runs"] += 1
+                total["seconds"] += stats.seconds
+                total["iterations"] += stats.iterations
+                total["unions"] += stats.unions
+        return totals
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """
+        Exports the records.
+
+        Args:
+            indent: JSON indentation.
+
+        Returns:
+            JSON object with the time of the export and a list with the
+            fields of every record.
+        """
+        with self._lock:
+            records = [stats._asdict() for stats in self.records]
+        return json.dumps({"time": time.time(), "records": records}, indent=indent)
 
 
 class LL1Table:
@@ -236,7 +1093,9 @@ class LL1Table:
 
         self.terminals: AbstractSet[str] = terminals
         self.non_terminals: AbstractSet[str] = non_terminals
-        self.cells: Dict[str, Dict[str, Optional[str]]] = {nt: {t: None for t in terminals} for nt in non_terminals}
+        self.cells: Dict[str, Dict[str, Optional[Tuple[str, ...]]]] = {nt: {t: None for t in terminals} for nt in non_terminals}
+        self._compiled: Optional[CompiledLL1Table] = None # Kept by compile until the cells change
+        self._rows: Optional[Dict[str, Dict[str, Tuple[Tuple[str, ...], Tuple[str, Tuple[str, ...]]]]]] = None # Kept by evaluate, likewise
 
     def __repr__(self) -> str:
         return (
@@ -246,14 +1105,15 @@ class LL1Table:
             f"cells={self.cells!r})"
         )
 
-    def add_cell(self, non_terminal: str, terminal: str, cell_body: str) -> None:
+    def add_cell(self, non_terminal: str, terminal: str, cell_body: Sequence[str]) -> None:
         """
         Adds a cell to an LL(1) table.
 
         Args:
             non_terminal: Non termial symbol (row)
             terminal: Terminal symbol (column)
-            cell_body: content of the cell 
+            cell_body: content of the cell, a sequence of symbols stored as
+              a tuple
 
         Raises:
             RepeatedCellError: if trying to add a cell already filled.
@@ -277,7 +1137,29 @@ class LL1Table:
             raise RepeatedCellError(
                 f"Repeated cell ({non_terminal}, {terminal}).")
         else:
-            self.cells[non_terminal][terminal] = cell_body
+            self.cells[non_terminal][terminal] = tuple(cell_body)
+            self.invalidate()
+
+    def copy(self) -> LL1Table:
+        """
+        Copies the table.
+
+        Returns:
+            LL1Table with the same symbols and cells, which can be changed
+            without affecting this one.
+        """
+        table = LL1Table(set(self.non_terminals), set(self.terminals))
+        table.cells = {nt: dict(row) for nt, row in self.cells.items()}
+        return table
+
+    def invalidate(self) -> None:
+        """
+        Drops what the table derives from its cells and keeps (the
+        compiled table and the rows used by evaluate). add_cell calls it;
+        code that changes self.cells directly must call it afterwards.
+        """
+        self._compiled = None
+        self._rows = None
 
     def analyze(self, input_string: str, start: str) -> ParseTree:
         """
@@ -328,7 +1210,667 @@ class LL1Table:
         if element_stack or input_chain: # If the input ends improperly, raise syntax error
             raise SyntaxError()
         return retTree # At the end, return the top of the tree
-  
+
+    def evaluate(
+        self,
+        input_string: Iterable[str],
+        start: str,
+        actions: Mapping[Tuple[str, Tuple[str, ...]], SemanticAction],
+        inherited: Any = None,
+    ) -> Any:
+        """
+        Method to analyze a string evaluating L-attributed rules during the
+        analysis, without building a parse tree. Every expansion pushes a
+        frame with the inherited attribute of the non terminal and the
+        attributes of its body, which is reduced with the synthesize rule
+        once the whole body has been matched.
+
+        Args:
+            input_string: string or sequence of terminal names to analyze.
+            start: initial symbol.
+            actions: attribute rules of every (non terminal, body).
+            inherited: inherited attribute of the initial symbol.
+
+        Returns:
+            Synthesized attribute of the initial symbol.
+
+        Raises:
+            SyntaxError: if the input string is not syntactically correct.
+        """
+        terminals = self.terminals
+        rows = self._rows
+        if rows is None: # Reversed body and key of the rules of every filled cell, built once
+            rows = self._rows = {
+                nt: {t: (body[::-1], (nt, body)) for t, body in row.items() if body is not None}
+                for nt, row in self.cells.items()
+            }
+
+        root: List[Any] = [None, inherited, []] # Frame [rules, inherited, values] that receives the attribute of start
+        frames = [root]
+        stack: List[Optional[str]] = ["$", start] # Pending symbols, None marks the end of a body
+        pop = stack.pop
+        push = stack.extend
+
+        for token in input_string:
+            if token not in terminals:
+                raise SyntaxError() # Syntax error! This is not a valid character
+            while True: # Expand non terminals until the token is matched
+                if not stack:
+                    raise SyntaxError() # Syntax error! Input continues after the end
+                top = pop()
+                if top is None: # Body complete: synthesize the attribute of its left side
+                    action, inh, values = frames.pop()
+                    frames[-1][2].append(None if action is None else action.synthesize(inh, values))
+                    continue
+                row = rows.get(top)
+                if row is None:
+                    if top != token:
+                        raise SyntaxError() # Syntax error! Input char is not correct
+                    frames[-1][2].append(token)
+                    break
+                entry = row.get(token)
+                if entry is None:
+                    raise SyntaxError() # Syntax error! No valid table value for this terminal
+                body, key = entry
+                action = actions.get(key) # Looked up on every expansion, so actions may change between calls
+                parent_action, parent_inh, parent_values = frames[-1]
+                if parent_action is not None and parent_action.inherit is not None:
+                    inh = parent_action.inherit(parent_inh, parent_values) # Only the symbols on its left are known
+                else:
+                    inh = parent_inh
+                frames.append([action, inh, []])
+                stack.append(None)
+                push(body)
+        if stack:
+            raise SyntaxError()
+        return root[2][0]
+
+    def recognize(self, input_string: Iterable[str], start: str) -> bool:
+        """
+        Method to check whether a string is accepted, using the LL(1) table
+        without building a parse tree.
+
+        Args:
+            input_string: string to analyze.
+            start: initial symbol.
+
+        Returns:
+            True if the string is syntactically correct, False otherwise.
+        """
+        terminals = self.terminals
+        cells = self.cells
+        stack = ["$", start] # Plain stack of pending symbols
+
+        for token in input_string:
+            if token not in terminals:
+                return False
+            while True: # Expand non terminals until the token is matched
+                if not stack:
+                    return False
+                top = stack.pop()
+                if top in terminals:
+                    if top != token:
+                        return False
+                    break
+                body = cells[top][token]
+                if body is None:
+                    return False
+                stack.extend(reversed(body))
+        return not stack
+
+    def push_parser(self, start: str, build_tree: bool = True) -> LL1PushParser:
+        """
+        Creates an incremental parser for this table.
+
+        Args:
+            start: initial symbol.
+            build_tree: whether to build the parse tree.
+
+        Returns:
+            LL1PushParser ready to be fed.
+        """
+        return LL1PushParser(self, start, build_tree)
+
+    def analyze_many(
+        self,
+        inputs: Iterable[Iterable[str]],
+        start: str,
+        workers: Optional[int] = None,
+        chunksize: int = 256,
+        ordered: bool = True,
+        build_tree: bool = True,
+    ) -> Iterator[Union[FlatParseTree, bool, SyntaxError, Tuple[int, Union[FlatParseTree, bool, SyntaxError]]]]:
+        """
+        Analyzes many independent strings in a pool of worker processes. See
+        CompiledLL1Table.analyze_many.
+        """
+        return self.compile().analyze_many(
+            inputs, start, workers, chunksize, ordered, build_tree,
+        )
+
+    def compile(self) -> CompiledLL1Table:
+        """
+        Compiles the table into integer arrays for fast analysis. The
+        compiled table is kept and returned again until add_cell changes
+        the table; after changing the cells directly, call invalidate.
+
+        Returns:
+            CompiledLL1Table with the current contents of the table. Later
+            changes to this table are not reflected in it.
+        """
+        if self._compiled is None:
+            self._compiled = CompiledLL1Table(self)
+        return self._compiled
+
+
+class CompiledLL1Table:
+    """
+    LL(1) table compiled to integer arrays. Terminals are interned as
+    0..T-1 and non terminals as T..T+N-1, every distinct cell body becomes a
+    production id and the table is a flat array of production ids (-1 for
+    empty cells) indexed by (non_terminal - T) * T + terminal.
+
+    Args:
+        table: LL(1) table to compile.
+
+    """
+
+    def __init__(self, table: LL1Table) -> None:
+        if '$' not in table.terminals:
+            raise ValueError(
+                "The end of chain symbol $ must be a terminal of the table.",
+            )
+
+        self.terminals: List[str] = sorted(table.terminals)
+        self.non_terminals: List[str] = sorted(table.non_terminals)
+        self.terminal_ids: Dict[str, int] = {t: i for i, t in enumerate(self.terminals)}
+        self.symbol_ids: Dict[str, int] = dict(self.terminal_ids)
+        for i, nt in enumerate(self.non_terminals, len(self.terminals)):
+            self.symbol_ids[nt] = i
+        self.names: List[str] = self.terminals + self.non_terminals + [""] # Name of every id, lambda is the last one
+
+        self.productions: List[Tuple[str, Tuple[str, ...]]] = [] # (non terminal, body) for each production id
+        self.rhs: List[Tuple[str, ...]] = [] # Body symbols in order, for tree construction
+        self.reversed_rhs: List[Tuple[int, ...]] = [] # Body ids in the order they are pushed on the stack
+        production_ids: Dict[Tuple[str, Tuple[str, ...]], int] = {}
+
+        n_terminals = len(self.terminals)
+        self.cells = array('i', [-1]) * (len(self.non_terminals) * n_terminals)
+        for nt, row in table.cells.items():
+            offset = (self.symbol_ids[nt] - n_terminals) * n_terminals
+            for t, body in row.items():
+                if body is None:
+                    continue
+                key = (nt, tuple(body))
+                if key not in production_ids:
+                    production_ids[key] = len(self.productions)
+                    self.productions.append(key)
+                    self.rhs.append(key[1])
+                    self.reversed_rhs.append(tuple(self.symbol_ids[x] for x in reversed(body)))
+                self.cells[offset + self.terminal_ids[t]] = production_ids[key]
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"terminals={self.terminals!r}, "
+            f"non_terminals={self.non_terminals!r}, "
+            f"productions={self.productions!r})"
+        )
+
+    def _start_id(self, start: str) -> int:
+        if start not in self.symbol_ids or start in self.terminal_ids:
+            raise ValueError(f"Invalid start symbol {start}.")
+        return self.symbol_ids[start]
+
+    def encode(self, tokens: Iterable[str]) -> array:
+        """
+        Interns a sequence of terminal names.
+
+        Args:
+            tokens: terminal symbols (a string is a sequence of one
+              character symbols).
+
+        Returns:
+            array('i') with the id of every token, which the analysis
+            methods accept in place of the tokens.
+
+        Raises:
+            SyntaxError: if some token is not a terminal of the table.
+        """
+        ids = list(map(self.terminal_ids.get, tokens))
+        if None in ids:
+            raise SyntaxError()
+        return array('i', ids)
+
+    def _token_ids(self, tokens: Iterable[str] | array | bytes) -> Iterable[Optional[int]]:
+        """
+        Token ids of an input, None for the tokens that are not terminals.
+        Arrays and bytes are taken as ids already.
+        """
+        if isinstance(tokens, (array, bytes, bytearray)):
+            if tokens and (min(tokens) < 0 or max(tokens) >= len(self.terminals)):
+                return [None]
+            return tokens
+        return map(self.terminal_ids.get, tokens)
+
+    def recognize(self, input_string: Iterable[str], start: str) -> bool:
+        """
+        Method to check whether a string is accepted, using the compiled
+        table without building a parse tree. Equivalent to
+        LL1Table.recognize.
+
+        Args:
+            input_string: string, sequence of terminal names or array of
+              terminal ids (see encode) to analyze.
+            start: initial symbol.
+
+        Returns:
+            True if the string is syntactically correct, False otherwise.
+        """
+        cells = self.cells
+        reversed_rhs = self.reversed_rhs
+        n_terminals = len(self.terminals)
+        symbol_stack = [self.terminal_ids['$'], self._start_id(start)] # Ids of the pending symbols
+        pop = symbol_stack.pop
+        push = symbol_stack.extend
+
+        for t in self._token_ids(input_string): # Same loop as LL1PushParser.feed, without its state
+            if t is None:
+                return False
+            while True:
+                if not symbol_stack:
+                    return False
+                top = pop()
+                if top < n_terminals:
+                    if top != t:
+                        return False
+                    break
+                production = cells[(top - n_terminals) * n_terminals + t]
+                if production < 0:
+                    return False
+                push(reversed_rhs[production])
+        return not symbol_stack
+
+    def analyze(self, input_string: Iterable[str], start: str) -> ParseTree:
+        """
+        Method to analyze a string using the compiled table. Equivalent to
+        LL1Table.analyze. The cyclic garbage collector is paused while the
+        tree is built: it only allocates nodes without cycles, and the
+        collections triggered by so many allocations would take a third of
+        the time.
+
+        Args:
+            input_string: string, sequence of terminal names or array of
+              terminal ids (see encode) to analyze.
+            start: initial symbol.
+
+        Returns:
+            ParseTree object with the parse tree.
+
+        Raises:
+            SyntaxError: if the input string is not syntactically correct.
+        """
+        start_id = self._start_id(start)
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            return self._build_tree(input_string, start, start_id)
+        finally:
+            if collecting:
+                gc.enable()
+
+    def _build_tree(self, input_string: Iterable[str], start: str, start_id: int) -> ParseTree:
+        cells = self.cells
+        rhs = self.rhs
+        reversed_rhs = self.reversed_rhs
+        n_terminals = len(self.terminals)
+
+        tree = ParseTree(start)
+        symbol_stack = [self.terminal_ids['$'], start_id] # Ids of the pending symbols
+        tree_stack = [ParseTree("$"), tree] # Tree node of each pending symbol
+        pop = symbol_stack.pop
+        push = symbol_stack.extend
+        pop_node = tree_stack.pop
+        push_nodes = tree_stack.extend
+
+        for t in self._token_ids(input_string):
+            if t is None:
+                raise SyntaxError() # Syntax error! This is not a valid terminal
+            while True: # Expand non terminals until the token is matched
+                if not symbol_stack:
+                    raise SyntaxError() # Syntax error! Input continues after the end
+                top = pop()
+                node = pop_node()
+                if top < n_terminals:
+                    if top != t:
+                        raise SyntaxError() # Syntax error! Input char is not correct
+                    break
+                production = cells[(top - n_terminals) * n_terminals + t]
+                if production < 0:
+                    raise SyntaxError() # Syntax error! No valid table value for this terminal
+                body = rhs[production]
+                if body:
+                    children = list(map(ParseTree, body))
+                    push(reversed_rhs[production])
+                    push_nodes(reversed(children))
+                    node.children = children
+                else:
+                    node.children = [ParseTree("")]
+        if symbol_stack: # If the input ends improperly, raise syntax error
+            raise SyntaxError()
+        return tree
+
+    def analyze_flat(self, input_string: Iterable[str], start: str) -> FlatParseTree:
+        """
+        Method to analyze a string using the compiled table, building the
+        parse tree as a FlatParseTree. The tree compares equal to the one
+        returned by analyze.
+
+        Args:
+            input_string: string, sequence of terminal names or array of
+              terminal ids (see encode) to analyze.
+            start: initial symbol.
+
+        Returns:
+            FlatParseTree object with the parse tree.
+
+        Raises:
+            SyntaxError: if the input string is not syntactically correct.
+        """
+        terminal_ids = self.terminal_ids
+        cells = self.cells
+        reversed_rhs = self.reversed_rhs
+        n_terminals = len(self.terminals)
+        end_id = terminal_ids['$']
+        lambda_id = len(self.names) - 1
+
+        symbols = array('i') # Symbol of every node, in the order they are popped: preorder
+        arities = array('i') # Number of children of every node
+        symbol_stack = [self._start_id(start)] # The end of chain is handled apart, it is not a tree node
+        pop = symbol_stack.pop
+        push = symbol_stack.extend
+        finished = False
+
+        for t in self._token_ids(input_string):
+            if t is None or finished:
+                raise SyntaxError()
+            while True:
+                if not symbol_stack: # Only the end of chain can come now
+                    if t != end_id:
+                        raise SyntaxError()
+                    finished = True
+                    break
+                top = pop()
+                symbols.append(top)
+                if top < n_terminals:
+                    if top != t:
+                        raise SyntaxError()
+                    arities.append(0)
+                    break
+                production = cells[(top - n_terminals) * n_terminals + t]
+                if production < 0:
+                    raise SyntaxError()
+                body = reversed_rhs[production]
+                if body:
+                    push(body)
+                    arities.append(len(body))
+                else: # Lambda leaf
+                    symbols.append(lambda_id)
+                    arities.append(1)
+                    arities.append(0)
+        if not finished:
+            raise SyntaxError()
+
+        sizes = array('i', [0]) * len(symbols)
+        completed: List[int] = [] # Sizes of the subtrees waiting for their parent
+        for i in range(len(symbols) - 1, -1, -1): # Backwards, children are completed before their parent
+            size = 1
+            for _ in range(arities[i]):
+                size += completed.pop()
+            completed.append(size)
+            sizes[i] = size
+        return FlatParseTree(self.names, symbols, sizes)
+
+    def push_parser(self, start: str, build_tree: bool = True) -> LL1PushParser:
+        """
+        Creates an incremental parser for this table.
+
+        Args:
+            start: initial symbol.
+            build_tree: whether to build the parse tree.
+
+        Returns:
+            LL1PushParser ready to be fed.
+        """
+        return LL1PushParser(self, start, build_tree)
+
+    def analyze_many(
+        self,
+        inputs: Iterable[Iterable[str]],
+        start: str,
+        workers: Optional[int] = None,
+        chunksize: int = 256,
+        ordered: bool = True,
+        build_tree: bool = True,
+    ) -> Iterator[Union[FlatParseTree, bool, SyntaxError, Tuple[int, Union[FlatParseTree, bool, SyntaxError]]]]:
+        """
+        Analyzes many independent strings in a pool of worker processes.
+        The table is sent once to every worker and the inputs are streamed
+        to them in chunks. Several batches can be analyzed at the same
+        time, interleaved or from different threads.
+
+        Args:
+            inputs: strings to analyze.
+            start: initial symbol.
+            workers: number of processes (by default, one per CPU). With a
+              single worker the strings are analyzed in this process.
+            chunksize: number of strings sent to a worker at a time.
+            ordered: whether results are produced in the order of the
+              inputs. Otherwise (index, result) pairs are produced as soon
+              as they are ready.
+            build_tree: whether to return the parse tree of every correct
+              string or just True.
+
+        Returns:
+            Iterator with the result for each string: its FlatParseTree
+            (or True) or the SyntaxError instance if it is not
+            syntactically correct. Flat trees compare equal to the trees
+            of analyze, and to_tree converts them; workers send them back
+            as two arrays, whatever the depth of the tree.
+
+        Raises:
+            ValueError: if start is not a non terminal of the table.
+        """
+        self._start_id(start) # Checked now rather than on the first result, or in every worker
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if workers <= 1:
+            def analyze(input_string: Iterable[str]) -> Union[FlatParseTree, bool, SyntaxError]:
+                return _analyze_one(self, start, build_tree, input_string)
+
+            if ordered:
+                return map(analyze, inputs)
+            return ((i, analyze(input_string)) for i, input_string in enumerate(inputs))
+        return self._analyze_in_pool(inputs, start, workers, chunksize, ordered, build_tree)
+
+    def _analyze_in_pool(
+        self,
+        inputs: Iterable[Iterable[str]],
+        start: str,
+        workers: int,
+        chunksize: int,
+        ordered: bool,
+        build_tree: bool,
+    ) -> Iterator[Union[FlatParseTree, bool, SyntaxError, Tuple[int, Union[FlatParseTree, bool, SyntaxError]]]]:
+        names = self.names
+
+        def result(value: Union[Tuple[array, array], bool, SyntaxError]) -> Union[FlatParseTree, bool, SyntaxError]:
+            if isinstance(value, tuple): # Symbols and sizes of a flat tree, the names are not sent back
+                return FlatParseTree(names, *value)
+            return value
+
+        with Pool(workers, _init_worker, (self, start, build_tree)) as pool:
+            if ordered:
+                for value in pool.imap(_worker_analyze, inputs, chunksize):
+                    yield result(value)
+            else:
+                for i, value in pool.imap_unordered(_worker_analyze_indexed, enumerate(inputs), chunksize):
+                    yield i, result(value)
+
+
+def _analyze_one(
+    table: CompiledLL1Table,
+    start: str,
+    build_tree: bool,
+    input_string: Iterable[str],
+) -> Union[FlatParseTree, bool, SyntaxError]:
+    try:
+        if build_tree:
+            return table.analyze_flat(input_string, start)
+        return table.recognize(input_string, start) or SyntaxError()
+    except SyntaxError as e:
+        return e
+
+# State of every analyze_many worker process, set once by its initializer
+_worker_table: Optional[CompiledLL1Table] = None
+_worker_start = ""
+_worker_build_tree = True
+
+def _init_worker(table: CompiledLL1Table, start: str, build_tree: bool) -> None:
+    global _worker_table, _worker_start, _worker_build_tree
+    _worker_table = table
+    _worker_start = start
+    _worker_build_tree = build_tree
+
+def _worker_analyze(input_string: Iterable[str]) -> Union[Tuple[array, array], bool, SyntaxError]:
+    value = _analyze_one(_worker_table, _worker_start, _worker_build_tree, input_string)
+    if isinstance(value, FlatParseTree): # Pickled as two flat arrays, not as a deep tree
+        return value.symbols, value.sizes
+    return value
+
+def _worker_analyze_indexed(item: Tuple[int, Iterable[str]]) -> Tuple[int, Union[Tuple[array, array], bool, SyntaxError]]:
+    return item[0], _worker_analyze(item[1])
+
+
+class LL1PushParser:
+    """
+    Incremental LL(1) parser. The input is fed in chunks of any size and
+    the prediction stack (and the partial parse tree, if requested) is kept
+    between calls. The end of chain symbol $ must be fed like any other
+    terminal before calling finish.
+
+    Args:
+        table: LL(1) table, compiled if it is not already.
+        start: initial symbol.
+        build_tree: whether to build the parse tree. Without it the memory
+          used is bounded by the depth of the stack.
+
+    """
+
+    def __init__(
+        self,
+        table: LL1Table | CompiledLL1Table,
+        start: str,
+        build_tree: bool = True,
+    ) -> None:
+        if isinstance(table, LL1Table):
+            table = table.compile()
+        self.table = table
+        self.build_tree = build_tree
+        self.tree: Optional[ParseTree] = ParseTree(start) if build_tree else None
+        self.failed = False
+
+        self._symbol_stack = [table.terminal_ids['$'], table._start_id(start)] # Ids of the pending symbols
+        self._tree_stack: List[ParseTree] = [ParseTree("$"), self.tree] if build_tree else [] # Tree node of each pending symbol
+
+    def _fail(self) -> SyntaxError:
+        self.failed = True
+        return SyntaxError()
+
+    def feed(self, chunk: Iterable[str]) -> None:
+        """
+        Analyzes the next chunk of the input.
+
+        Args:
+            chunk: next part of the input, as a string, a sequence of
+              terminal names or an array of terminal ids.
+
+        Raises:
+            SyntaxError: as soon as the input is known to be incorrect.
+        """
+        if self.failed:
+            raise SyntaxError()
+
+        table = self.table
+        cells = table.cells
+        reversed_rhs = table.reversed_rhs
+        n_terminals = len(table.terminals)
+        symbol_stack = self._symbol_stack
+        pop = symbol_stack.pop
+        push = symbol_stack.extend
+
+        if not self.build_tree:
+            for t in table._token_ids(chunk):
+                if t is None:
+                    raise self._fail() # Syntax error! This is not a valid terminal
+                while True: # Expand non terminals until the token is matched
+                    if not symbol_stack:
+                        raise self._fail() # Syntax error! Input continues after the end
+                    top = pop()
+                    if top < n_terminals:
+                        if top != t:
+                            raise self._fail() # Syntax error! Input char is not correct
+                        break
+                    production = cells[(top - n_terminals) * n_terminals + t]
+                    if production < 0:
+                        raise self._fail() # Syntax error! No valid table value for this terminal
+                    push(reversed_rhs[production])
+            return
+
+        rhs = table.rhs
+        tree_stack = self._tree_stack
+        for t in table._token_ids(chunk): # Same loop, keeping a tree node for every pending symbol
+            if t is None:
+                raise self._fail()
+            while True:
+                if not symbol_stack:
+                    raise self._fail()
+                top = pop()
+                node = tree_stack.pop()
+                if top < n_terminals:
+                    if top != t:
+                        raise self._fail()
+                    break
+                production = cells[(top - n_terminals) * n_terminals + t]
+                if production < 0:
+                    raise self._fail()
+                body = rhs[production]
+                if body:
+                    children = [ParseTree(x) for x in body]
+                    push(reversed_rhs[production])
+                    tree_stack.extend(children[::-1])
+                    node.children = children
+                else:
+                    node.children = [ParseTree("")]
+
+    def finish(self) -> Optional[ParseTree]:
+        """
+        Ends the analysis.
+
+        Returns:
+            ParseTree object with the parse tree, or None if the tree is not
+            being built.
+
+        Raises:
+            SyntaxError: if the input fed so far is not a complete, correct
+              string.
+        """
+        if self.failed or self._symbol_stack: # If the input ends improperly, raise syntax error
+            raise self._fail()
+        return self.tree
+
+
 class ParseTree():
     """
     Parse Tree.
@@ -337,23 +1879,165 @@ class ParseTree():
         root: root node of the tree.
         children: list of children, which are also ParseTree objects.
     """
-    def __init__(self, root: str, children: Collection[ParseTree] = []) -> None:
+    __slots__ = ('root', 'children')
+
+    def __init__(self, root: str, children: Collection[ParseTree] = ()) -> None:
         self.root = root
         self.children = children
 
     def __repr__(self) -> str:
-        return (
-            f"{type(self).__name__}({self.root!r}: {self.children})"
-        )
+        return _tree_repr(self, type(self).__name__)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
             return NotImplemented
-        return (
-            self.root == other.root
-            and len(self.children) == len(other.children)
-            and all([x.__eq__(y) for x, y in zip(self.children, other.children)])
-        )
+        return _trees_equal(self, other)
 
     def add_children(self, children: Collection[ParseTree]) -> None:
         self.children = children
+
+
+class FlatParseTree:
+    """
+    Parse tree stored as two flat arrays in preorder: the symbol id of
+    every node and the number of nodes in its subtree. The children of a
+    node start right after it, each one after the subtree of the previous
+    one. It behaves like the ParseTree of its root node (root, children,
+    comparison), through FlatParseTreeNode views created on demand.
+
+    Args:
+        names: name of every symbol id.
+        symbols: symbol id of every node, in preorder.
+        sizes: number of nodes in the subtree of every node, in preorder.
+    """
+    __slots__ = ('names', 'symbols', 'sizes', '_root')
+
+    def __init__(self, names: Sequence[str], symbols: array, sizes: array) -> None:
+        self.names = names
+        self.symbols = symbols
+        self.sizes = sizes
+        self._root = FlatParseTreeNode(self, 0)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __repr__(self) -> str:
+        return repr(self._root)
+
+    def __eq__(self, other: object) -> bool:
+        return self._root == other
+
+    @property
+    def root(self) -> str:
+        return self._root.root
+
+    @property
+    def children(self) -> List[FlatParseTreeNode]:
+        return self._root.children
+
+    def to_tree(self) -> ParseTree:
+        """
+        Converts the flat tree into linked ParseTree objects.
+
+        Returns:
+            Equivalent ParseTree.
+        """
+        names = self.names
+        symbols = self.symbols
+        sizes = self.sizes
+        nodes = [ParseTree(names[symbols[i]]) for i in range(len(symbols))]
+        for i, node in enumerate(nodes):
+            end = i + sizes[i]
+            j = i + 1
+            if j < end:
+                children = []
+                while j < end: # Jump from child to child over their subtrees
+                    children.append(nodes[j])
+                    j += sizes[j]
+                node.children = children
+        return nodes[0]
+
+
+class FlatParseTreeNode:
+    """
+    View of a node of a FlatParseTree, compatible with ParseTree. Views are
+    created on demand, so they are cheap but not kept: two accesses to the
+    same child give equal, not identical, objects.
+
+    Args:
+        tree: flat tree the node belongs to.
+        index: preorder position of the node.
+    """
+    __slots__ = ('tree', 'index')
+
+    def __init__(self, tree: FlatParseTree, index: int) -> None:
+        self.tree = tree
+        self.index = index
+
+    @property
+    def root(self) -> str:
+        return self.tree.names[self.tree.symbols[self.index]]
+
+    @property
+    def children(self) -> List[FlatParseTreeNode]:
+        tree = self.tree
+        sizes = tree.sizes
+        end = self.index + sizes[self.index]
+        children = []
+        j = self.index + 1
+        while j < end: # Jump from child to child over their subtrees
+            children.append(FlatParseTreeNode(tree, j))
+            j += sizes[j]
+        return children
+
+    def __repr__(self) -> str:
+        return _tree_repr(self, "ParseTree")
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FlatParseTree):
+            other = other._root
+        if isinstance(other, FlatParseTreeNode) and other.tree.names == self.tree.names:
+            # Same symbol ids: compare the preorder slices directly
+            a, b = self.tree, other.tree
+            n = a.sizes[self.index]
+            if n != b.sizes[other.index]:
+                return False
+            i, j = self.index, other.index
+            return a.symbols[i:i + n] == b.symbols[j:j + n] and a.sizes[i:i + n] == b.sizes[j:j + n]
+        if not isinstance(other, (ParseTree, FlatParseTreeNode)):
+            return NotImplemented
+        return _trees_equal(self, other)
+
+
+def _trees_equal(a: ParseTree | FlatParseTreeNode, b: ParseTree | FlatParseTreeNode) -> bool:
+    """Structural comparison with an explicit stack, stopping at the first difference."""
+    pending = [(a, b)]
+    while pending:
+        x, y = pending.pop()
+        if x.root != y.root:
+            return False
+        x_children = x.children
+        y_children = y.children
+        if len(x_children) != len(y_children):
+            return False
+        pending.extend(zip(x_children, y_children))
+    return True
+
+
+def _tree_repr(tree: ParseTree | FlatParseTreeNode, name: str) -> str:
+    """Nested representation of a tree, built with an explicit stack."""
+    parts: List[str] = []
+    pending: List[object] = [tree] # Nodes still to be written, or closing text
+    while pending:
+        item = pending.pop()
+        if isinstance(item, str):
+            parts.append(item)
+            continue
+        parts.append(f"{name}({item.root!r}: [")
+        pending.append("])")
+        children = item.children
+        for k in range(len(children) - 1, -1, -1): # Reversed, so they are popped in order
+            pending.append(children[k])
+            if k:
+                pending.append(", ")
+    return "".join(parts)
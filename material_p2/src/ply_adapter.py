@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from typing import Any, Iterator, Mapping, Optional
+
+from src.grammar import CompiledLL1Table, LL1PushParser, LL1Table, ParseTree, SyntaxError
+
+
+def lexer_tokens(
+    lexer: Any,
+    data: Optional[str] = None,
+    type_map: Optional[Mapping[str, str]] = None,
+) -> Iterator[str]:
+    """
+    Terminals of the tokens produced by a PLY lexer, followed by the end of
+    chain symbol $. Tokens are requested from the lexer one at a time, as
+    they are consumed.
+
+    Args:
+        lexer: PLY lexer (anything with a token method returning objects
+          with a type attribute, and None at the end).
+        data: input for the lexer. If None, the lexer must already have its
+          input.
+        type_map: terminal for every token type that is not written as the
+          terminal itself.
+
+    Returns:
+        Iterator over the terminal names.
+    """
+    if data is not None:
+        lexer.input(data)
+    token = lexer.token
+    if type_map is None:
+        for tok in iter(token, None):
+            yield tok.type
+    else:
+        for tok in iter(token, None):
+            yield type_map.get(tok.type, tok.type)
+    yield "$"
+
+
+def analyze_tokens(
+    table: LL1Table | CompiledLL1Table,
+    lexer: Any,
+    data: Optional[str],
+    start: str,
+    type_map: Optional[Mapping[str, str]] = None,
+    build_tree: bool = True,
+) -> Optional[ParseTree]:
+    """
+    Analyzes the output of a PLY lexer with an LL(1) table. Lexing and
+    parsing are interleaved: the analysis stops at the first wrong token,
+    without reading the rest of the input.
+
+    Args:
+        table: LL(1) table, compiled if it is not already. An LL1Table
+          keeps its compiled form, so it is only compiled the first time.
+        lexer: PLY lexer.
+        data: input for the lexer, or None if it already has it.
+        start: initial symbol.
+        type_map: terminal for every token type that is not written as the
+          terminal itself.
+        build_tree: whether to build the parse tree.
+
+    Returns:
+        ParseTree object with the parse tree, or None if it is not built.
+
+    Raises:
+        SyntaxError: if the tokens are not syntactically correct.
+    """
+    parser = LL1PushParser(table, start, build_tree)
+    parser.feed(lexer_tokens(lexer, data, type_map))
+    return parser.finish()
+
+
+def recognize_tokens(
+    table: LL1Table | CompiledLL1Table,
+    lexer: Any,
+    data: Optional[str],
+    start: str,
+    type_map: Optional[Mapping[str, str]] = None,
+) -> bool:
+    """
+    Checks whether the output of a PLY lexer is accepted by an LL(1) table,
+    without building a parse tree.
+
+    Args:
+        table: LL(1) table, compiled if it is not already.
+        lexer: PLY lexer.
+        data: input for the lexer, or None if it already has it.
+        start: initial symbol.
+        type_map: terminal for every token type that is not written as the
+          terminal itself.
+
+    Returns:
+        True if the tokens are syntactically correct, False otherwise,
+        including when the lexer fails on an illegal character.
+    """
+    tokens = lexer_tokens(lexer, data, type_map)
+    lexer_failed = False
+
+    def checked() -> Iterator[str]:
+        nonlocal lexer_failed
+        try:
+            yield from tokens
+        except Exception: # PLY lexers raise plain exceptions from t_error
+            lexer_failed = True
+
+    parser = LL1PushParser(table, start, build_tree=False)
+    try:
+        parser.feed(checked())
+        parser.finish()
+    except SyntaxError:
+        return False
+    return not lexer_failed
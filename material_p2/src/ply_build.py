@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import copy
+import os
+import threading
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING: # PLY is imported when a parser is built, not with the grammar modules
+    from typing import Any, Callable, Optional
+
+    import ply.lex as lex
+    import ply.yacc as yacc
+
+
+class Lazy:
+    """
+    Value built on first use and kept afterwards. The builder runs once,
+    even if several threads ask for the value at the same time.
+
+    Args:
+        build: function that builds the value.
+    """
+
+    def __init__(self, build: Callable[[], Any]) -> None:
+        self._build = build
+        self._value = None
+        self._lock = threading.Lock()
+
+    def __call__(self) -> Any:
+        value = self._value
+        if value is None:
+            with self._lock:
+                if self._value is None:
+                    self._value = self._build()
+                value = self._value
+        return value
+
+
+class ParseContext:
+    """
+    State of a single parse. The grammar rules reach it as
+    p.parser.context.
+
+    Attributes:
+        error: whether a syntax error was found.
+    """
+
+    def __init__(self) -> None:
+        self.error = False
+
+    def on_error(self, token: Any) -> None:
+        self.error = True
+
+
+class BoundParser:
+    """
+    PLY parser tied to the lexer of its grammar. PLY parsers read from the
+    last lexer built in the process unless they are given one, so several
+    grammars in the same process would read each other's tokens.
+
+    PLY keeps the state of a parse in the parser and the lexer objects, so
+    every parse works on its own shallow copy of the parser (the tables are
+    shared) and its own clone of the lexer, with its own ParseContext.
+    Any number of threads can parse at the same time.
+
+    Args:
+        parser: PLY parser.
+        lexer: lexer of the grammar.
+    """
+
+    def __init__(self, parser: yacc.LRParser, lexer: lex.Lexer) -> None:
+        self.parser = parser
+        self.lexer = lexer
+
+    def parse(
+        self,
+        input: Optional[str] = None,
+        lexer: Optional[lex.Lexer] = None,
+        debug: bool = False,
+        tracking: bool = False,
+        context: Optional[ParseContext] = None,
+    ) -> Any:
+        """
+        Parses a string.
+
+        Args:
+            input: string to parse.
+            lexer: lexer to use instead of a clone of the grammar lexer.
+            debug: PLY debug flag.
+            tracking: PLY position tracking flag.
+            context: state of this parse, new if not given.
+
+        Returns:
+            Value of the start symbol.
+        """
+        parser = copy.copy(self.parser)
+        parser.context = ParseContext() if context is None else context
+        parser.errorfunc = parser.context.on_error # Syntax errors are recorded in the context
+        return parser.parse(input, lexer or self.lexer.clone(), debug, tracking)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.parser, name)
+
+
+def build_lexer(module: ModuleType, lextab: str, write_tables: bool = False) -> lex.Lexer:
+    """
+    Builds the lexer of a module. If its table module (lextab) exists the
+    lexer is read from it in optimize mode, without validating the rules
+    again; otherwise it is built in memory. Nothing is written unless
+    asked.
+
+    Args:
+        module: module with the token rules.
+        lextab: package qualified name of the table module.
+        write_tables: whether to write the table module next to the
+          token rules module, to regenerate it after changing the rules.
+
+    Returns:
+        PLY lexer.
+    """
+    import importlib.util
+
+    import ply.lex as lex
+
+    if write_tables or importlib.util.find_spec(lextab) is None:
+        lexer = lex.lex(module=module) # PLY only writes tables in optimize mode
+        if write_tables:
+            lexer.writetab(lextab, os.path.dirname(module.__file__))
+        return lexer
+    return lex.lex(module=module, optimize=True, lextab=lextab)
+
+
+def build_parser(module: ModuleType, tabmodule: str, lexer: lex.Lexer, write_tables: bool = False) -> BoundParser:
+    """
+    Builds the parser of a module in optimize mode, reading the LALR tables
+    from its table module, without debug output. Nothing is written unless
+    asked: if the table module is missing the tables are built in memory.
+
+    Args:
+        module: module with the grammar rules.
+        tabmodule: package qualified name of the table module.
+        lexer: lexer of the grammar.
+        write_tables: whether to write the table module next to the
+          grammar module, to regenerate it after changing the grammar.
+
+    Returns:
+        Parser bound to the lexer.
+    """
+    import ply.yacc as yacc
+
+    parser = yacc.yacc(
+        module=module,
+        tabmodule=tabmodule,
+        optimize=not write_tables, # Regenerating must not trust the old tables
+        debug=False,
+        write_tables=write_tables,
+        outputdir=os.path.dirname(module.__file__) if write_tables else None,
+    )
+    return BoundParser(parser, lexer)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from array import array
+from itertools import repeat
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from src.roman_lexer import t_ignore
+
+MAX_VALUE = 999 # The grammar has no thousands: M only appears in CM
+
+_DELETE_IGNORED = str.maketrans("", "", t_ignore)
+
+
+def _place_forms(one: str, five: str, ten: str) -> Dict[str, int]:
+    """
+    Numerals of a decimal place, as in the rules of roman_parser: up to
+    three ones (LowUnits), one five followed by up to three ones, and the
+    subtractive forms one-five and one-ten. Runs of more than three ones
+    break the count constraint of the grammar.
+    """
+    forms = {}
+    for k in range(4):
+        forms[one * k] = k
+        forms[five + one * k] = 5 + k
+    forms[one + five] = 4
+    forms[one + ten] = 9
+    return forms
+
+
+def _build_tables() -> Tuple[Dict[str, int], List[str]]:
+    decode_table: Dict[str, int] = {}
+    for h, vh in _place_forms("C", "D", "M").items():
+        for t, vt in _place_forms("X", "L", "C").items():
+            for u, vu in _place_forms("I", "V", "X").items():
+                decode_table[h + t + u] = 100 * vh + 10 * vt + vu
+
+    encode_table = [""] * (MAX_VALUE + 1)
+    for numeral, value in decode_table.items():
+        encode_table[value] = numeral
+    assert len(decode_table) == MAX_VALUE + 1 # Every value has a single numeral
+    return decode_table, encode_table
+
+
+_DECODE, _ENCODE = _build_tables() # About 1000 entries each
+
+
+def decode(numeral: str) -> int:
+    """
+    Value of a Roman numeral, with the same results as roman_parser: blanks
+    are ignored and the empty numeral is 0.
+
+    Args:
+        numeral: Roman numeral.
+
+    Returns:
+        Its value, between 0 and 999.
+
+    Raises:
+        ValueError: if the numeral is not valid.
+    """
+    value = _DECODE.get(numeral)
+    if value is None:
+        value = _DECODE.get(numeral.translate(_DELETE_IGNORED))
+        if value is None:
+            raise ValueError(f"Invalid Roman numeral {numeral!r}.")
+    return value
+
+
+def encode(value: int) -> str:
+    """
+    Roman numeral of a value.
+
+    Args:
+        value: integer between 0 and 999.
+
+    Returns:
+        Its Roman numeral, as decode reads it.
+
+    Raises:
+        ValueError: if the value is out of range.
+    """
+    if not 0 <= value <= MAX_VALUE:
+        raise ValueError(f"Value {value} out of range.")
+    return _ENCODE[value]
+
+
+def decode_many(numerals: Iterable[str]) -> array:
+    """
+    Values of many Roman numerals.
+
+    Args:
+        numerals: Roman numerals.
+
+    Returns:
+        array('i') with the value of every numeral, -1 for the invalid ones
+        (as the val of roman_parser).
+    """
+    if not isinstance(numerals, Sequence):
+        numerals = list(numerals)
+    get = _DECODE.get
+    values = array("i", map(get, numerals, repeat(-1)))
+    if -1 in values: # Only the misses are looked at again, in case they have blanks
+        for i, value in enumerate(values):
+            if value == -1:
+                values[i] = get(numerals[i].translate(_DELETE_IGNORED), -1)
+    return values
+
+
+def encode_many(values: Iterable[int]) -> List[str]:
+    """
+    Roman numerals of many values.
+
+    Args:
+        values: integers between 0 and 999 (any iterable, such as an
+          array).
+
+    Returns:
+        List with the numeral of every value.
+
+    Raises:
+        ValueError: if some value is out of range.
+    """
+    if not isinstance(values, Sequence):
+        values = list(values)
+    if values and (min(values) < 0 or max(values) > MAX_VALUE): # Negative indices would not fail
+        raise ValueError("Value out of range.")
+    return list(map(_ENCODE.__getitem__, values))
@@ -1,4 +1,7 @@
-import ply.lex as lex
+import sys
+
+from src.bulk_lexer import BulkLexer
+from src.ply_build import Lazy, build_lexer
 
 # Lista de tokens que necesitamos para los números romanos
 tokens = (
@@ -22,12 +25,23 @@ def t_error(t):
     print(f"Caracter ilegal: {t.value[0]}")
     raise Exception("Caracter ilegal")
 
-# Construir el lexer
-lexer = lex.lex()
+# Construir el lexer la primera vez que se usa, a partir de src/roman_lextab.py
+get_lexer = Lazy(lambda: build_lexer(sys.modules[__name__], "src.roman_lextab"))
+
+# Lexer de todo el texto a la vez, para estos tokens de un solo carácter
+get_bulk_lexer = Lazy(lambda: BulkLexer.from_module(sys.modules[__name__]))
+
+__all__ = ["tokens", "get_lexer", "lexer", "get_bulk_lexer"]
+
+def __getattr__(name):
+    if name == "lexer":
+        return get_lexer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
     # Prueba del lexer
     data = 'MCMXCIV'
+    lexer = get_lexer()
     lexer.input(data)
 
     while True:
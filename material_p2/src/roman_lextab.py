@@ -0,0 +1,10 @@
+# roman_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('C', 'D', 'I', 'L', 'M', 'V', 'X'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_C>C)|(?P<t_D>D)|(?P<t_I>I)|(?P<t_L>L)|(?P<t_M>M)|(?P<t_V>V)|(?P<t_X>X)', [None, (None, 'C'), (None, 'D'), (None, 'I'), (None, 'L'), (None, 'M'), (None, 'V'), (None, 'X')])]}
+_lexstateignore = {'INITIAL': ' \t\n'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
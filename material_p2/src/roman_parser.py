@@ -1,25 +1,23 @@
-import ply.yacc as yacc
-from src.roman_lexer import tokens
+import sys
+
+from src.roman_lexer import get_lexer, tokens
+from src.ply_build import Lazy, build_parser
 
 # Gramática
-global errorflagRoman 
-errorflagRoman = False
 
 def p_romanNumber(p):
     """
     Language : Hundred Tens Units
     """
 
-    global errorflagRoman
     # Get count
     countH = p[1]["count"]
     countT = p[2]["count"]
     countU = p[3]["count"]
 
     # Constraints
-    if countH > 3 or countT > 3 or countU > 3 or errorflagRoman is True:
+    if countH > 3 or countT > 3 or countU > 3 or p.parser.context.error:
         p[0] = {"val":-1, "valid":False}
-        errorflagRoman = False # Resets the global variable for the next test in case it was changed
         return
 
     # If valid, calculate arabic number and return in dictionary
@@ -115,13 +113,20 @@ def p_empty(p):
     pass
 
 
-# Manejo de errores sintácticos
+# Manejo de errores sintácticos: cada análisis los anota en su propio contexto
+# (p.parser.context, ver src.ply_build.BoundParser), que sustituye a esta función
 def p_error(p):
-    global errorflagRoman
-    errorflagRoman = True
+    pass
+
+# Construir el parser la primera vez que se usa, a partir de src/roman_parsetab.py
+get_parser = Lazy(lambda: build_parser(sys.modules[__name__], "src.roman_parsetab", get_lexer()))
+
+__all__ = ["tokens", "get_parser", "parser"]
 
-# Construir el parser
-parser = yacc.yacc()
+def __getattr__(name):
+    if name == "parser":
+        return get_parser()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
     while True:
@@ -131,6 +136,6 @@ if __name__ == "__main__":
             break
         if not s:
             continue
-        result = parser.parse(s)
+        result = get_parser().parse(s)
         print(f"El valor numérico es: {result}")
 
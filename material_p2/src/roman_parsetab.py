@@ -0,0 +1,50 @@
+
+# roman_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'C D I L M V X\n    Language : Hundred Tens Units\n    \n    LowHundreds : C LowHundreds\n                | lambda\n    \n    Hundred : LowHundreds\n            | C D\n            | D LowHundreds\n            | C M\n    \n    LowTens : X LowTens \n            | lambda\n    \n    Tens : LowTens\n         | X L\n         | L LowTens\n         | X C\n    \n    LowUnits : I LowUnits \n             | lambda\n    \n    Units : LowUnits\n          | I V\n          | V LowUnits\n          | I X\n    lambda :'
+    
+_lr_action_items = {'C':([0,4,5,9,12,],[4,12,12,24,12,]),'D':([0,4,],[5,13,]),'X':([0,2,3,4,5,6,9,10,12,13,14,15,16,19,22,],[-20,9,-4,-20,-20,-3,22,22,-20,-5,-7,-2,-6,29,22,]),'L':([0,2,3,4,5,6,9,12,13,14,15,16,],[-20,10,-4,-20,-20,-3,23,-20,-5,-7,-2,-6,]),'I':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,19,20,22,23,24,25,26,27,],[-20,-20,-4,-20,-20,-3,19,-10,-20,-20,-9,-20,-5,-7,-2,-6,27,27,-20,-11,-13,-8,-12,27,]),'V':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,19,22,23,24,25,26,],[-20,-20,-4,-20,-20,-3,20,-10,-20,-20,-9,-20,-5,-7,-2,-6,28,-20,-11,-13,-8,-12,]),'$end':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,],[-20,0,-20,-4,-20,-20,-3,-20,-10,-20,-20,-9,-20,-5,-7,-2,-6,-1,-16,-20,-20,-15,-20,-11,-13,-8,-12,-20,-17,-19,-14,-18,]),'M':([4,],[14,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'Language':([0,],[1,]),'Hundred':([0,],[2,]),'LowHundreds':([0,4,5,12,],[3,15,16,15,]),'lambda':([0,2,4,5,7,9,10,12,19,20,22,27,],[6,11,6,6,21,11,11,6,21,21,11,21,]),'Tens':([2,],[7,]),'LowTens':([2,9,10,22,],[8,25,26,25,]),'Units':([7,],[17,]),'LowUnits':([7,19,20,27,],[18,30,31,30,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> Language","S'",1,None,None,None),
+  ('Language -> Hundred Tens Units','Language',3,'p_romanNumber','roman_parser.py',12),
+  ('LowHundreds -> C LowHundreds','LowHundreds',2,'p_small_hundred','roman_parser.py',35),
+  ('LowHundreds -> lambda','LowHundreds',1,'p_small_hundred','roman_parser.py',36),
+  ('Hundred -> LowHundreds','Hundred',1,'p_hundred','roman_parser.py',46),
+  ('Hundred -> C D','Hundred',2,'p_hundred','roman_parser.py',47),
+  ('Hundred -> D LowHundreds','Hundred',2,'p_hundred','roman_parser.py',48),
+  ('Hundred -> C M','Hundred',2,'p_hundred','roman_parser.py',49),
+  ('LowTens -> X LowTens','LowTens',2,'p_small_ten','roman_parser.py',62),
+  ('LowTens -> lambda','LowTens',1,'p_small_ten','roman_parser.py',63),
+  ('Tens -> LowTens','Tens',1,'p_ten','roman_parser.py',72),
+  ('Tens -> X L','Tens',2,'p_ten','roman_parser.py',73),
+  ('Tens -> L LowTens','Tens',2,'p_ten','roman_parser.py',74),
+  ('Tens -> X C','Tens',2,'p_ten','roman_parser.py',75),
+  ('LowUnits -> I LowUnits','LowUnits',2,'p_small_digit','roman_parser.py',89),
+  ('LowUnits -> lambda','LowUnits',1,'p_small_digit','roman_parser.py',90),
+  ('Units -> LowUnits','Units',1,'p_digit','roman_parser.py',99),
+  ('Units -> I V','Units',2,'p_digit','roman_parser.py',100),
+  ('Units -> V LowUnits','Units',2,'p_digit','roman_parser.py',101),
+  ('Units -> I X','Units',2,'p_digit','roman_parser.py',102),
+  ('lambda -> <empty>','lambda',0,'p_empty','roman_parser.py',116),
+]
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+import tempfile
+from typing import Optional
+
+from src.grammar import Grammar, LL1Table
+
+# Bump when the layout of the cached payload changes
+CACHE_VERSION = 2
+_MAGIC = b"LL1T"
+
+
+def _cache_path(cache_dir: str, fingerprint: str) -> str:
+    return os.path.join(cache_dir, f"ll1_{fingerprint}.marshal")
+
+
+def _load(path: str, fingerprint: str) -> tuple:
+    """Reads a cache entry. Raises ValueError if it is stale or corrupt."""
+    with open(path, "rb") as f:
+        data = f.read()
+    digest, payload = data[len(_MAGIC):len(_MAGIC) + 32], data[len(_MAGIC) + 32:]
+    if not data.startswith(_MAGIC) or hashlib.sha256(payload).digest() != digest:
+        raise ValueError("Corrupt cache entry.")
+    entry = marshal.loads(payload)
+    if not isinstance(entry, tuple) or len(entry) != 5 or entry[:2] != (CACHE_VERSION, fingerprint):
+        raise ValueError("Stale cache entry.")
+    return entry
+
+
+def _store(path: str, entry: tuple) -> None:
+    """Writes a cache entry atomically. Write errors are ignored."""
+    payload = marshal.dumps(entry)
+    data = _MAGIC + hashlib.sha256(payload).digest() + payload
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError: # A read-only cache directory just means no caching
+        pass
+
+
+def get_cached_ll1_table(grammar: Grammar, cache_dir: str) -> Optional[LL1Table]:
+    """
+    Returns the LL(1) table of a grammar, loading it from an on-disk cache
+    keyed by the grammar fingerprint. On a hit no grammar analysis is done.
+    Missing, stale or corrupt entries are rebuilt with get_ll1_table and
+    written back.
+
+    Args:
+        grammar: grammar whose table is requested.
+        cache_dir: directory holding the cache entries. It is created if
+          needed.
+
+    Returns:
+        LL(1) table for the grammar, or None if the grammar is not LL(1).
+    """
+    fingerprint = grammar.fingerprint()
+    path = _cache_path(cache_dir, fingerprint)
+
+    try:
+        _, _, terminals, non_terminals, cells = _load(path, fingerprint)
+    except (OSError, ValueError, EOFError, TypeError):
+        table = grammar.get_ll1_table()
+        cells = None if table is None else table.cells
+        _store(path, (
+            CACHE_VERSION,
+            fingerprint,
+            frozenset(grammar.terminals | {'$'}),
+            frozenset(grammar.non_terminals),
+            cells,
+        ))
+        return table
+
+    if cells is None: # Cached negative answer: the grammar is not LL(1)
+        return None
+    table = LL1Table(set(non_terminals), set(terminals))
+    table.cells = cells
+    return table
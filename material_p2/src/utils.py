@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import csv
+import io
+import json
 import re
-from collections import defaultdict
-from typing import AbstractSet, DefaultDict, Dict, List
+import sys
+from typing import AbstractSet, Dict, List, Optional, Sequence, TextIO, Tuple
 
 from src.grammar import Grammar, LL1Table, ParseTree
 
@@ -15,13 +18,17 @@ class GrammarFormat():
     re_empty = re.compile(r"\s*")
     re_production = re.compile(r"\s*(\S)\s*->\s*(\S*)\s*")
 
+    @classmethod
+    def _split_body(cls, right: str) -> Tuple[str, ...]:
+        return tuple(right) # Every character is a symbol
+
     @classmethod
     def read(cls, description: str) -> Grammar:
         splitted_lines = description.splitlines()
 
         terminals: AbstractSet[str] = set()
         non_terminals = set()
-        productions: Dict[str, List[str]] = {}
+        productions: Dict[str, List[Tuple[str, ...]]] = {}
         axiom = None
 
         for line in splitted_lines:
@@ -31,6 +38,7 @@ class GrammarFormat():
             match = cls.re_production.fullmatch(line)
             if match:
                 left, right = match.groups()
+                right = cls._split_body(right)
                 if axiom is None:
                     axiom = left
                 non_terminals.add(left)
@@ -48,45 +56,142 @@ class GrammarFormat():
         return Grammar(terminals, non_terminals, productions, axiom)
 
 
-def write_table(table: LL1Table) -> str:
-    col_widths: DefaultDict[str, int] = defaultdict(int)
-    total_width = 0
-    for t in table.terminals:
-        for nt in table.non_terminals:
-            width = 5
-            right = table.cells[nt][t]
+class TokenGrammarFormat(GrammarFormat):
+    """
+    Grammar format whose symbols are words separated by blanks, so that
+    terminals such as "id" or "==" can be used. An empty right side is a
+    lambda production::
+
+        Expr -> Term Expr'
+        Expr' -> + Term Expr'
+        Expr' ->
+    """
+    re_production = re.compile(r"\s*(\S+)\s*->\s*(.*?)\s*")
+
+    @classmethod
+    def _split_body(cls, right: str) -> Tuple[str, ...]:
+        return tuple(sys.intern(x) for x in right.split()) # Interned, so equal symbols compare by identity
+
+    @classmethod
+    def write(cls, grammar: Grammar) -> str:
+        """
+        Writes a grammar in this format, axiom first, so that read gives an
+        equal grammar back (terminals that do not appear in any production
+        are not kept).
+
+        Args:
+            grammar: grammar to write.
+
+        Returns:
+            Text of the grammar.
+        """
+        order = [grammar.axiom] + sorted(nt for nt in grammar.productions if nt != grammar.axiom)
+        lines = []
+        for nt in order:
+            for body in grammar.productions[nt]:
+                lines.append(f"{nt} -> {' '.join(body)}".rstrip())
+        return "\n".join(lines) + "\n"
+
+
+def _separator(table: LL1Table) -> str:
+    """
+    Separator of the symbols of the bodies, the same for the whole table
+    so that no two bodies look alike: none if every symbol has one
+    character, as in the grammar, and a blank otherwise.
+    """
+    if all(len(x) == 1 for x in table.terminals) and all(len(x) == 1 for x in table.non_terminals):
+        return ""
+    return " "
+
+def _cell_text(body: Optional[Sequence[str]], separator: str) -> str:
+    if body is None:
+        return ""
+    if not body:
+        return "λ"
+    return separator.join(body)
+
+def dump_table(table: LL1Table, fp: TextIO) -> None:
+    """
+    Writes the LL(1) table as text to a file-like object, row by row.
+    Terminals and non terminals are written in sorted order.
+
+    Args:
+        table: LL(1) table to write.
+        fp: text file-like object.
+    """
+    terminals = sorted(table.terminals)
+    non_terminals = sorted(table.non_terminals)
+    separator = _separator(table)
+
+    col_widths = dict.fromkeys(terminals, 5) # Sizing pass: one look at every cell
+    for nt in non_terminals:
+        row = table.cells[nt]
+        for t in terminals:
+            right = row[t]
             if right is not None:
-                x = right
-                if x == '':
-                    width += 2
-                else:
-                    width += len(x)
-            if width > col_widths[t]:
-                col_widths[t] = width
-        total_width += col_widths[t] + 1
-
-    table_str = "-" * (6 + total_width) + "\n"
-    table_str += "      "
-    for t in table.terminals:
-        table_str += f"{t}" + " " * col_widths[t]
-    table_str += "\n"
-    table_str += "-" * (6 + total_width) + "\n"
-    for nt in table.non_terminals:
-        table_str += f"{nt}     "
-        for t in table.terminals:
-            right = table.cells[nt][t]
-            if right is None:
-                table_str += " " * (col_widths[t] + 1)
-                continue
-            x = right
-            if x == '':
-                table_str += "λ" + " " * (col_widths[t])
-            else:
-                table_str += f"{x}" + " " * (col_widths[t] - len(x) + 1)
-        table_str += "\n"
-    table_str += "-" * (6 + total_width)
+                width = 5 + (2 if not right else len(_cell_text(right, separator)))
+                if width > col_widths[t]:
+                    col_widths[t] = width
+    total_width = sum(col_widths[t] + 1 for t in terminals)
+    rule = "-" * (6 + total_width)
+
+    fp.write(rule + "\n")
+    fp.write("      " + "".join(f"{t}" + " " * col_widths[t] for t in terminals) + "\n")
+    fp.write(rule + "\n")
+    for nt in non_terminals: # Rendering pass: one line written at a time
+        row = table.cells[nt]
+        parts = [f"{nt}     "]
+        for t in terminals:
+            x = _cell_text(row[t], separator)
+            parts.append(x + " " * (col_widths[t] - len(x) + 1))
+        fp.write("".join(parts) + "\n")
+    fp.write(rule)
 
-    return table_str
+def write_table(table: LL1Table) -> str:
+    table_str = io.StringIO()
+    dump_table(table, table_str)
+    return table_str.getvalue()
+
+def dump_table_csv(table: LL1Table, fp: TextIO) -> None:
+    """
+    Writes the LL(1) table as CSV to a file-like object: a header with the
+    terminals and a row per non terminal. Empty cells are empty fields and
+    lambda bodies are written as λ.
+
+    Args:
+        table: LL(1) table to write.
+        fp: text file-like object, opened with newline=''.
+    """
+    terminals = sorted(table.terminals)
+    separator = _separator(table)
+    writer = csv.writer(fp)
+    writer.writerow([""] + terminals)
+    for nt in sorted(table.non_terminals):
+        row = table.cells[nt]
+        writer.writerow([nt] + [_cell_text(row[t], separator) for t in terminals])
+
+def dump_table_json(table: LL1Table, fp: TextIO) -> None:
+    """
+    Writes the LL(1) table as JSON to a file-like object, one row at a
+    time. The object has the sorted "terminals" and "non_terminals" and
+    the filled "cells" of every non terminal, each body as a list of
+    symbols (lambda bodies are []).
+
+    Args:
+        table: LL(1) table to write.
+        fp: text file-like object.
+    """
+    terminals = sorted(table.terminals)
+    non_terminals = sorted(table.non_terminals)
+    fp.write('{"terminals": ' + json.dumps(terminals, ensure_ascii=False))
+    fp.write(', "non_terminals": ' + json.dumps(non_terminals, ensure_ascii=False))
+    fp.write(', "cells": {')
+    for k, nt in enumerate(non_terminals):
+        row = table.cells[nt]
+        filled = {t: list(row[t]) for t in terminals if row[t] is not None}
+        fp.write(("" if k == 0 else ", ") + json.dumps(nt, ensure_ascii=False) + ": ")
+        fp.write(json.dumps(filled, ensure_ascii=False))
+    fp.write("}}\n")
 
 def parse_tree_to_dot(ptree: ParseTree) -> str:
     return (
@@ -98,8 +203,17 @@ def parse_tree_to_dot(ptree: ParseTree) -> str:
     )
 
 def parse_tree_to_dot_rec(ptree: ParseTree) -> str:
-    return (
-        f'"node{id(ptree)}" [label="{ptree.root}", shape=circle]\n'
-        + "\n".join([parse_tree_to_dot_rec(x) for x in ptree.children])
-        + "\n".join([f"node{id(ptree)} -> node{id(x)}\n" for x in ptree.children])
-    )
+    # Explicit stack and a single join: linear time at any depth.
+    # Nodes are numbered in visiting order, so views without a stable id()
+    # (such as the nodes of a FlatParseTree) work too.
+    lines: List[str] = []
+    pending = [(ptree, 0)]
+    next_id = 1
+    while pending:
+        node, node_id = pending.pop()
+        lines.append(f'"node{node_id}" [label="{node.root}", shape=circle]\n')
+        for child in node.children:
+            lines.append(f"node{node_id} -> node{next_id}\n")
+            pending.append((child, next_id))
+            next_id += 1
+    return "".join(lines)
@@ -1,7 +1,9 @@
+import gc
 import unittest
+from array import array
 
 from src.grammar import Grammar, LL1Table, ParseTree, SyntaxError
-from src.utils import GrammarFormat
+from src.utils import GrammarFormat, TokenGrammarFormat, parse_tree_to_dot, write_table
 from typing import Optional, Type
 
 class TestAnalyze(unittest.TestCase):
@@ -18,6 +20,11 @@ class TestAnalyze(unittest.TestCase):
             else:
                 with self.assertRaises(exception):
                     table.analyze(input_string, start)
+            self.assertEqual(table.recognize(input_string, start), exception is None)
+            self.assertEqual(
+                table.compile().recognize(input_string, start),
+                exception is None,
+            )
 
     def _check_analyze_from_grammar(
             self,
@@ -135,6 +142,238 @@ class TestAnalyze(unittest.TestCase):
         
         self._check_parse_tree(table, "i*i$", "E", tree)
 
+    def test_case4(self) -> None:
+        """Test for syntax analysis with the compiled table."""
+        grammar_str = """
+        E -> TX
+        X -> +E
+        X ->
+        T -> iY
+        T -> (E)
+        Y -> *T
+        Y ->
+        """
+
+        table = GrammarFormat.read(grammar_str).get_ll1_table()
+        assert table is not None
+        compiled = table.compile()
+
+        for input_string in ("i*i$", "i*i+i$", "i*i+i+(i*i)$", "i*(i+i*(i))+i$"):
+            with self.subTest(string=input_string):
+                self.assertEqual(
+                    compiled.analyze(input_string, "E"),
+                    table.analyze(input_string, "E"),
+                )
+        for input_string in ("a", "(i$", "i*i$i", "i*i", "+i*i", "", "$"):
+            with self.subTest(string=input_string):
+                with self.assertRaises(SyntaxError):
+                    compiled.analyze(input_string, "E")
+        self.assertTrue(gc.isenabled()) # The collector is resumed after errors too
+        gc.disable()
+        try:
+            compiled.analyze("i$", "E")
+            self.assertFalse(gc.isenabled()) # And left paused if it was
+        finally:
+            gc.enable()
+
+    def test_case5(self) -> None:
+        """Test for incremental analysis with the push parser."""
+        grammar_str = """
+        E -> TX
+        X -> +E
+        X ->
+        T -> iY
+        T -> (E)
+        Y -> *T
+        Y ->
+        """
+
+        table = GrammarFormat.read(grammar_str).get_ll1_table()
+        assert table is not None
+
+        input_string = "i*(i+i*i)+i$"
+        for size in (1, 2, 5, len(input_string)):
+            with self.subTest(chunk_size=size):
+                parser = table.push_parser("E")
+                for i in range(0, len(input_string), size):
+                    parser.feed(input_string[i:i + size])
+                self.assertEqual(parser.finish(), table.analyze(input_string, "E"))
+
+        parser = table.push_parser("E", build_tree=False)
+        parser.feed("i*(")
+        with self.assertRaises(SyntaxError):
+            parser.feed("i+)")
+        with self.assertRaises(SyntaxError):
+            parser.feed("i$")
+
+        parser = table.push_parser("E")
+        parser.feed("i*i")
+        with self.assertRaises(SyntaxError):
+            parser.finish()
+
+        # Parsers share the compiled table until the table changes
+        manual = LL1Table({"S"}, {"a", "$"})
+        manual.add_cell("S", "a", "aS")
+        compiled = manual.compile()
+        self.assertIs(manual.push_parser("S").table, compiled)
+        manual.add_cell("S", "$", "")
+        self.assertIsNot(manual.compile(), compiled)
+        self.assertTrue(manual.compile().recognize("aa$", "S"))
+        self.assertFalse(compiled.recognize("aa$", "S"))
+        manual.cells["S"]["$"] = None # Direct changes are seen after invalidate
+        self.assertTrue(manual.compile().recognize("aa$", "S"))
+        manual.invalidate()
+        self.assertFalse(manual.compile().recognize("aa$", "S"))
+
+    def test_case6(self) -> None:
+        """Test for batch analysis in worker processes."""
+        grammar_str = """
+        E -> TX
+        X -> +E
+        X ->
+        T -> iY
+        T -> (E)
+        Y -> *T
+        Y ->
+        """
+
+        table = GrammarFormat.read(grammar_str).get_ll1_table()
+        assert table is not None
+        inputs = ["i*i$", "(i$", "i+(i*i)$", "i*i", "i$"] * 20
+
+        results = list(table.analyze_many(inputs, "E", workers=2, chunksize=7))
+        self.assertEqual(len(results), len(inputs))
+        for input_string, result in zip(inputs, results):
+            if table.recognize(input_string, "E"):
+                self.assertEqual(result, table.analyze(input_string, "E"))
+            else:
+                self.assertIsInstance(result, SyntaxError)
+
+        unordered = table.analyze_many(
+            inputs, "E", workers=2, ordered=False, build_tree=False,
+        )
+        accepted = {}
+        for i, result in unordered:
+            accepted[i] = result is True
+        self.assertEqual(
+            accepted,
+            {i: table.recognize(x, "E") for i, x in enumerate(inputs)},
+        )
+
+        # In-process batches do not share state, even interleaved
+        compiled = table.compile()
+        trees = compiled.analyze_many(inputs, "E", workers=1)
+        checks = compiled.analyze_many(inputs, "T", workers=1, build_tree=False)
+        for input_string, tree, check in zip(inputs, trees, checks):
+            with self.subTest(string=input_string):
+                if table.recognize(input_string, "E"):
+                    self.assertEqual(tree, table.analyze(input_string, "E"))
+                else:
+                    self.assertIsInstance(tree, SyntaxError)
+                self.assertEqual(check is True, table.recognize(input_string, "T"))
+        with self.assertRaises(ValueError): # Before any result is requested
+            compiled.analyze_many(inputs, "Z", workers=1)
+
+        # Deep trees come back from the workers
+        deep = GrammarFormat.read("S -> aS\nS ->\n").get_ll1_table()
+        deep_input = "a" * 3000 + "$"
+        result, = deep.analyze_many([deep_input], "S", workers=2)
+        self.assertEqual(len(result), 2 * 3000 + 2) # S and a nodes, and the last S -> lambda
+        self.assertEqual(result, deep.compile().analyze_flat(deep_input, "S"))
+
+    def test_case7(self) -> None:
+        """Test for flat parse tree construction."""
+        grammar_str = """
+        E -> TX
+        X -> +E
+        X ->
+        T -> iY
+        T -> (E)
+        Y -> *T
+        Y ->
+        """
+
+        table = GrammarFormat.read(grammar_str).get_ll1_table()
+        assert table is not None
+        compiled = table.compile()
+
+        for input_string in ("i$", "i*i$", "i*(i+i*(i))+i$"):
+            with self.subTest(string=input_string):
+                tree = table.analyze(input_string, "E")
+                flat = compiled.analyze_flat(input_string, "E")
+                self.assertEqual(flat, tree)
+                self.assertEqual(tree, flat)
+                self.assertEqual(flat.to_tree(), tree)
+        self.assertNotEqual(
+            compiled.analyze_flat("i*i$", "E"),
+            table.analyze("i+i$", "E"),
+        )
+        self.assertEqual(len(compiled.analyze_flat("i$", "E")), 7)
+        for input_string in ("a", "(i$", "i*i$i", "i*i", "+i*i"):
+            with self.subTest(string=input_string):
+                with self.assertRaises(SyntaxError):
+                    compiled.analyze_flat(input_string, "E")
+
+    def test_case8(self) -> None:
+        """Test for deep parse trees, well beyond the recursion limit."""
+        grammar = GrammarFormat.read("""
+        S -> aS
+        S ->
+        """)
+        table = grammar.get_ll1_table()
+        assert table is not None
+        compiled = table.compile()
+        input_string = "a" * 20000 + "$"
+
+        tree = table.analyze(input_string, "S")
+        flat = compiled.analyze_flat(input_string, "S")
+        self.assertEqual(tree, compiled.analyze(input_string, "S"))
+        self.assertEqual(tree, flat)
+        self.assertNotEqual(tree, table.analyze(input_string[1:], "S"))
+        self.assertEqual(repr(tree), repr(flat))
+        self.assertTrue(repr(tree).startswith("ParseTree('S': [ParseTree('a': []), "))
+
+        dot = parse_tree_to_dot(tree)
+        self.assertEqual(dot, parse_tree_to_dot(flat))
+        self.assertEqual(dot.count(" -> "), len(flat) - 1)
+
+    def test_case9(self) -> None:
+        """Test for multi-character terminals and non terminals."""
+        grammar_str = """
+        Expr -> Term Expr'
+        Expr' -> + Term Expr'
+        Expr' ->
+        Term -> id Term'
+        Term -> num Term'
+        Term -> ( Expr )
+        Term' -> ** Term
+        Term' ->
+        """
+
+        grammar = TokenGrammarFormat.read(grammar_str)
+        self.assertEqual(grammar.terminals, {"+", "id", "num", "(", ")", "**"})
+        self.assertEqual(grammar.compute_first(["Term'"]), {"**", ""})
+        table = grammar.get_ll1_table()
+        assert table is not None
+        self.assertEqual(table.cells["Term"]["id"], ("id", "Term'"))
+        self.assertEqual(table.cells["Expr'"]["$"], ())
+        self.assertIn("id Term'", write_table(table))
+        compiled = table.compile()
+
+        tokens = ["id", "**", "(", "num", "+", "id", ")", "$"]
+        tree = table.analyze(tokens, "Expr")
+        self.assertEqual(tree.children[0].children[0], ParseTree("id", []))
+        self.assertEqual(compiled.analyze(tokens, "Expr"), tree)
+        self.assertEqual(compiled.analyze_flat(tokens, "Expr"), tree)
+        self.assertEqual(compiled.analyze_flat(compiled.encode(tokens), "Expr"), tree)
+        self.assertTrue(compiled.recognize(compiled.encode(tokens), "Expr"))
+
+        for wrong in (["id", "id", "$"], ["i", "d", "$"], ["id", "*", "*", "id", "$"]):
+            self._check_analyze(table, wrong, "Expr", exception=SyntaxError)
+        with self.assertRaises(SyntaxError):
+            compiled.encode(["id", "*", "$"])
+        self.assertFalse(compiled.recognize(array('i', [len(compiled.terminals)]), "Expr"))
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,124 @@
+import unittest
+
+from src.grammar import SyntaxError
+from src.utils import GrammarFormat
+
+
+class TestAttributes(unittest.TestCase):
+    def test_case1(self) -> None:
+        """Test for a^n b^n c^k with k >= n + 1, using inherited attributes."""
+        grammar = GrammarFormat.read("""
+        S -> ABC
+        A -> aA
+        A ->
+        B -> bB
+        B ->
+        C -> cD
+        D -> cD
+        D ->
+        """)
+        # A counts the a's, B gets them as inherited attribute and counts down
+        grammar.set_action("S", "ABC",
+            lambda inh, v: v[1] and v[2] >= v[0] + 1,
+            inherit=lambda inh, v: v[0] if v else None)
+        grammar.set_action("A", "aA", lambda inh, v: v[1] + 1)
+        grammar.set_action("A", "", lambda inh, v: 0)
+        grammar.set_action("B", "bB",
+            lambda inh, v: v[1],
+            inherit=lambda inh, v: inh - 1)
+        grammar.set_action("B", "", lambda inh, v: inh == 0)
+        grammar.set_action("C", "cD", lambda inh, v: v[1] + 1)
+        grammar.set_action("D", "cD", lambda inh, v: v[1] + 1)
+        grammar.set_action("D", "", lambda inh, v: 0)
+
+        for input_string, valid in (
+            ("aabbccc$", True),
+            ("c$", True),
+            ("abcc$", True),
+            ("aabbcc$", False),
+            ("aabccc$", False),
+            ("abbccc$", False),
+        ):
+            with self.subTest(string=input_string):
+                self.assertEqual(grammar.evaluate(input_string), valid)
+        self.assertTrue(grammar.evaluate("a" * 10000 + "b" * 10000 + "c" * 10001 + "$"))
+
+        for input_string in ("bbaaccc$", "aabb$", "aabbccc", "abc$c"):
+            with self.subTest(string=input_string):
+                with self.assertRaises(SyntaxError):
+                    grammar.evaluate(input_string)
+
+        with self.assertRaises(ValueError):
+            grammar.set_action("S", "AB", lambda inh, v: None)
+
+        # Rules changed after an evaluation are used by the next one
+        grammar.set_action("D", "cD", lambda inh, v: v[1] + 2)
+        self.assertTrue(grammar.evaluate("aabbcc$")) # Every c after the first counts twice
+
+    def test_case2(self) -> None:
+        """Test for the value of Roman numerals below one hundred."""
+        grammar = GrammarFormat.read("""
+        N -> AB
+        A -> XP
+        A -> LQ
+        A ->
+        P -> XR
+        P -> L
+        P -> C
+        P ->
+        R -> X
+        R ->
+        Q -> XZ
+        Q ->
+        Z -> XR
+        Z ->
+        B -> IU
+        B -> VW
+        B ->
+        U -> IS
+        U -> V
+        U -> X
+        U ->
+        S -> I
+        S ->
+        W -> IY
+        W ->
+        Y -> IS
+        Y ->
+        """)
+        for nt, body, value in (
+            ("N", "AB", lambda inh, v: 10 * v[0] + v[1]),
+            ("A", "XP", lambda inh, v: 1 + v[1]),
+            ("A", "LQ", lambda inh, v: 5 + v[1]),
+            ("P", "XR", lambda inh, v: 1 + v[1]),
+            ("P", "L", lambda inh, v: 3),
+            ("P", "C", lambda inh, v: 8),
+            ("R", "X", lambda inh, v: 1),
+            ("Q", "XZ", lambda inh, v: 1 + v[1]),
+            ("Z", "XR", lambda inh, v: 1 + v[1]),
+            ("B", "IU", lambda inh, v: 1 + v[1]),
+            ("B", "VW", lambda inh, v: 5 + v[1]),
+            ("U", "IS", lambda inh, v: 1 + v[1]),
+            ("U", "V", lambda inh, v: 3),
+            ("U", "X", lambda inh, v: 8),
+            ("S", "I", lambda inh, v: 1),
+            ("W", "IY", lambda inh, v: 1 + v[1]),
+            ("Y", "IS", lambda inh, v: 1 + v[1]),
+        ):
+            grammar.set_action(nt, body, value)
+        for nt in "APRQZBUSWY":
+            grammar.set_action(nt, "", lambda inh, v: 0)
+
+        for input_string, value in (
+            ("XIV$", 14), ("XCIX$", 99), ("LXXXVIII$", 88), ("XL$", 40), ("IX$", 9), ("$", 0),
+        ):
+            with self.subTest(string=input_string):
+                self.assertEqual(grammar.evaluate(input_string), value)
+        for input_string in ("IIII$", "VX$", "IL$", "XXXX$"):
+            with self.subTest(string=input_string):
+                with self.assertRaises(SyntaxError):
+                    grammar.evaluate(input_string)
+
+
+if __name__ == '__main__':
+    unittest.main()
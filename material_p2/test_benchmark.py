@@ -0,0 +1,45 @@
+import json
+import unittest
+
+from src.benchmark import _fresh_grammar, compare, expression_input, layered_grammar, parse_size, run
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_case1(self) -> None:
+        """Test for the inputs and grammars of the benchmarks."""
+        self.assertEqual(parse_size("100M"), 10 ** 8)
+        self.assertEqual(parse_size("1.5K"), 1500)
+        data = expression_input(10 ** 4)
+        self.assertLessEqual(abs(len(data) - 10 ** 4), 8)
+        grammar = layered_grammar(5)
+        self.assertEqual(len(grammar.non_terminals), 11)
+        self.assertTrue(grammar.is_ll1())
+
+        # Grammars are prepared up to the phase to time
+        for phases in range(3):
+            with self.subTest(phases=phases):
+                analysis = _fresh_grammar(lambda: layered_grammar(5), phases)._get_analysis()
+                self.assertEqual(analysis.first is not None, phases >= 1)
+                self.assertEqual(analysis.follow is not None, phases >= 2)
+                self.assertIsNone(analysis.partial_table)
+
+    def test_case2(self) -> None:
+        """Test for a small run and its comparison with itself."""
+        results = run(max_size=1000, levels=(2,), generated=(10,), repeat=1)
+        results = json.loads(json.dumps(results))
+        names = {r["name"] for r in results["results"]}
+        self.assertIn("LL1Table.analyze", names)
+        self.assertIn("roman_parser.parse", names)
+        rows = compare(results, results)
+        self.assertEqual(len(rows), len(results["results"]))
+        self.assertFalse(any(row["regression"] for row in rows))
+
+        old = dict(results, version=results["version"] - 1) # Times measured differently
+        with self.assertRaises(ValueError):
+            compare(results, old)
+        with self.assertRaises(ValueError):
+            compare(results, {"results": results["results"]})
+
+
+if __name__ == '__main__':
+    unittest.main()
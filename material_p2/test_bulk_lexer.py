@@ -0,0 +1,57 @@
+import unittest
+
+import src.g1_lexer as g1_lexer
+from src.bulk_lexer import BulkLexer, IllegalCharacterError
+from src.roman_lexer import get_bulk_lexer, get_lexer
+from src.utils import GrammarFormat
+
+
+class TestBulkLexer(unittest.TestCase):
+    def test_case1(self) -> None:
+        """Test for the same tokens as the PLY lexer."""
+        bulk = get_bulk_lexer()
+        lexer = get_lexer().clone()
+        for data in ("MCMXCIV", " XIV\n\tX ", "", "IIII" * 100):
+            with self.subTest(data=data):
+                lexer.input(data)
+                self.assertEqual(bulk.token_types(bulk.tokenize(data)), [tok.type for tok in iter(lexer.token, None)])
+        self.assertEqual(bulk.tokenize(b"MDI"), bulk.tokenize("MDI"))
+
+    def test_case2(self) -> None:
+        """Test for the offset of the first illegal character."""
+        bulk = get_bulk_lexer()
+        for data, offset in (("XIZ", 2), ("X I zZ", 4), ("XIñ Z", 2), ("Zñ", 0)):
+            with self.subTest(data=data):
+                with self.assertRaises(IllegalCharacterError) as cm:
+                    bulk.tokenize(data)
+                self.assertEqual(cm.exception.offset, offset)
+                self.assertEqual(cm.exception.char, data[offset])
+
+        with self.assertRaises(ValueError):
+            BulkLexer({"id": "id"})
+        with self.assertRaises(ValueError):
+            BulkLexer({"a": "a"}, ids={"b": 0})
+
+    def test_case3(self) -> None:
+        """Test for token ids taken from a compiled LL(1) table."""
+        grammar = GrammarFormat.read("""
+        S -> ABC
+        A -> aA
+        A ->
+        B -> bB
+        B ->
+        C -> cD
+        D -> cD
+        D ->
+        """)
+        compiled = grammar.get_compiled_ll1_table()
+        assert compiled is not None
+        bulk = BulkLexer.from_module(g1_lexer, ids=compiled.terminal_ids)
+        end = bytes([compiled.terminal_ids["$"]])
+        self.assertTrue(compiled.recognize(bulk.tokenize("aa bb ccc") + end, "S"))
+        self.assertFalse(compiled.recognize(bulk.tokenize("aa bb ccc"), "S"))
+        self.assertFalse(compiled.recognize(bulk.tokenize("ba") + end, "S"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+
+from src.codegen import compile_table, generate_source, write_module
+from src.grammar import SyntaxError
+from src.utils import GrammarFormat, TokenGrammarFormat
+
+
+class TestCodegen(unittest.TestCase):
+    def _check_same(self, table, generated, input_string, start) -> None:
+        with self.subTest(string=input_string):
+            try:
+                expected = table.analyze(input_string, start)
+            except SyntaxError:
+                expected = None
+            if expected is None:
+                with self.assertRaises(SyntaxError):
+                    generated.analyze(input_string, start)
+            else:
+                self.assertEqual(generated.analyze(input_string, start), expected)
+            self.assertEqual(generated.recognize(input_string, start), expected is not None)
+
+    def test_case1(self) -> None:
+        """Test for the generated analyzer of a grammar with lambda productions."""
+        grammar_str = """
+        E -> TX
+        X -> +E
+        X ->
+        T -> iY
+        T -> (E)
+        Y -> *T
+        Y ->
+        """
+        table = GrammarFormat.read(grammar_str).get_ll1_table()
+        assert table is not None
+        generated = compile_table(table)
+
+        for input_string in (
+            "i$", "i*i$", "i*(i+i*(i))+i$", "(i)$",
+            "", "$", "i", "(i$", "i*i$i", "+i*i$", "i**i$", "a$",
+        ):
+            self._check_same(table, generated, input_string, "E")
+        self._check_same(table, generated, "i*i$", "T")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "generated_e.py")
+            write_module(table, path)
+            spec = importlib.util.spec_from_file_location("generated_e", path)
+            assert spec is not None and spec.loader is not None
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self.assertEqual(module.analyze("i+i$", "E"), table.analyze("i+i$", "E"))
+
+    def test_case2(self) -> None:
+        """Test for symbols that are not valid Python names."""
+        grammar_str = """
+        Expr -> Term Expr'
+        Expr' -> + Term Expr'
+        Expr' ->
+        Term -> id
+        Term -> ( Expr )
+        """
+        table = TokenGrammarFormat.read(grammar_str).get_ll1_table()
+        assert table is not None
+        self.assertEqual(generate_source(table), generate_source(table))
+        generated = compile_table(table)
+
+        for tokens in (["id", "+", "id", "$"], ["(", "id", ")", "$"], ["id", "id", "$"], ["id", "+", "$"]):
+            self._check_same(table, generated, tokens, "Expr")
+
+
+if __name__ == '__main__':
+    unittest.main()
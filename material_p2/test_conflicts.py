@@ -0,0 +1,71 @@
+import unittest
+
+from src.grammar import LL1Conflict
+from src.utils import GrammarFormat
+
+
+class TestConflicts(unittest.TestCase):
+    def test_case1(self) -> None:
+        """Test for an LL(1) grammar: no conflicts."""
+        grammar_str = """
+        E -> TX
+        X -> +E
+        X ->
+        T -> iY
+        T -> (E)
+        Y -> *T
+        Y ->
+        """
+
+        grammar = GrammarFormat.read(grammar_str)
+        table, conflicts = grammar.get_ll1_conflicts()
+        self.assertEqual(conflicts, [])
+        self.assertEqual(table.cells, grammar.get_ll1_table().cells)
+
+    def test_case2(self) -> None:
+        """Test for every conflict collected in one pass."""
+        grammar_str = """
+        S -> aS
+        S -> a
+        S -> A
+        A -> bB
+        A ->
+        B -> bc
+        B -> Bd
+        C -> Cc
+        C -> c
+        """
+
+        grammar = GrammarFormat.read(grammar_str)
+        self.assertIsNone(grammar.get_ll1_table())
+        table, conflicts = grammar.get_ll1_conflicts()
+        self.assertEqual(conflicts, [
+            LL1Conflict("B", "b", (("b", "c"), ("B", "d")), LL1Conflict.FIRST_FIRST),
+            LL1Conflict("C", "c", (("C", "c"), ("c",)), LL1Conflict.FIRST_FIRST),
+            LL1Conflict("S", "a", (("a", "S"), ("a",)), LL1Conflict.FIRST_FIRST),
+        ])
+        self.assertEqual(table.cells["S"]["a"], ("a", "S"))
+        self.assertEqual(table.cells["S"]["b"], ("A",))
+        self.assertEqual(table.cells["B"]["b"], ("b", "c"))
+
+        grammar.add_production("A", "d") # d also follows A, through B -> Bd
+        grammar.add_production("B", "A")
+        _, conflicts = grammar.get_ll1_conflicts()
+        kinds = {(c.non_terminal, c.terminal): c.kind for c in conflicts}
+        self.assertEqual(kinds[("A", "d")], LL1Conflict.FIRST_FOLLOW)
+        self.assertEqual(kinds[("S", "a")], LL1Conflict.FIRST_FIRST)
+
+    def test_case3(self) -> None:
+        """Test for nullable productions, which never collide with themselves."""
+        grammar = GrammarFormat.read("S -> Cc\nC -> A\nA -> c\nA ->\n")
+        table, conflicts = grammar.get_ll1_conflicts()
+        self.assertEqual(conflicts, [LL1Conflict("A", "c", (("c",), ()), LL1Conflict.FIRST_FOLLOW)])
+        self.assertEqual(table.cells["C"]["c"], ("A",)) # c is both in FIRST(A) and in FOLLOW(C)
+
+        grammar.remove_production("A", "c")
+        self.assertTrue(grammar.is_ll1())
+        self.assertEqual(grammar.get_ll1_table().cells["C"]["c"], ("A",))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import csv
+import io
+import json
+import unittest
+
+from src.grammar import LL1Table
+from src.utils import GrammarFormat, TokenGrammarFormat, dump_table, dump_table_csv, dump_table_json, write_table
+
+
+class TestDump(unittest.TestCase):
+    grammar_str = """
+    E -> TX
+    X -> +E
+    X ->
+    T -> iY
+    T -> (E)
+    Y -> *T
+    Y ->
+    """
+
+    def _table(self) -> LL1Table:
+        table = GrammarFormat.read(self.grammar_str).get_ll1_table()
+        assert table is not None
+        return table
+
+    def _reordered(self, table: LL1Table) -> LL1Table:
+        """Copy of a table with its symbols and cells inserted in reverse order."""
+        copy = LL1Table(set(reversed(sorted(table.non_terminals))), set(reversed(sorted(table.terminals))))
+        for nt in reversed(sorted(table.non_terminals)):
+            for t in reversed(sorted(table.terminals)):
+                if table.cells[nt][t] is not None:
+                    copy.add_cell(nt, t, table.cells[nt][t])
+        return copy
+
+    def test_case1(self) -> None:
+        """Test for the text table."""
+        table = self._table()
+        text = write_table(table)
+        self.assertEqual(text, write_table(self._reordered(table)))
+
+        lines = text.split("\n")
+        self.assertEqual(len(lines), 3 + 4 + 1) # Rules and header, a line per non terminal, closing rule
+        self.assertEqual(lines[1].split(), ["$", "(", ")", "*", "+", "i"])
+        self.assertEqual([line.split()[0] for line in lines[3:7]], ["E", "T", "X", "Y"])
+        self.assertEqual(lines[3].split(), ["E", "TX", "TX"]) # Empty cells are blank
+        self.assertEqual(lines[6].split(), ["Y", "λ", "λ", "*T", "λ"])
+        header = lines[1]
+        self.assertEqual(lines[3].index("TX"), header.index("(")) # Every cell starts under its terminal
+        self.assertEqual(lines[3].rindex("TX"), header.index("i"))
+        self.assertEqual(lines[6].index("*T"), header.index("*"))
+
+        fp = io.StringIO()
+        dump_table(table, fp)
+        self.assertEqual(fp.getvalue(), text)
+
+    def test_case2(self) -> None:
+        """Test for the CSV table."""
+        table = self._table()
+        fp = io.StringIO(newline="")
+        dump_table_csv(table, fp)
+        other = io.StringIO(newline="")
+        dump_table_csv(self._reordered(table), other)
+        self.assertEqual(fp.getvalue(), other.getvalue())
+
+        rows = list(csv.reader(io.StringIO(fp.getvalue(), newline="")))
+        self.assertEqual(rows[0], ["", "$", "(", ")", "*", "+", "i"])
+        self.assertEqual([row[0] for row in rows[1:]], ["E", "T", "X", "Y"])
+        self.assertEqual(rows[3], ["X", "λ", "", "λ", "", "+E", ""])
+        for row in rows[1:]:
+            for t, text in zip(rows[0][1:], row[1:]):
+                with self.subTest(non_terminal=row[0], terminal=t):
+                    body = table.cells[row[0]][t]
+                    if body is None:
+                        self.assertEqual(text, "")
+                    elif not body:
+                        self.assertEqual(text, "λ")
+                    else:
+                        self.assertEqual(tuple(text), body)
+
+        # Bodies with longer symbols are separated by blanks
+        tokens = TokenGrammarFormat.read("S -> id Rest\nRest -> , id Rest\nRest ->\n").get_ll1_table()
+        assert tokens is not None
+        fp = io.StringIO(newline="")
+        dump_table_csv(tokens, fp)
+        rows = list(csv.reader(io.StringIO(fp.getvalue(), newline="")))
+        self.assertEqual(rows[0], ["", "$", ",", "id"])
+        self.assertEqual(rows[1:], [["Rest", "λ", ", id Rest", ""], ["S", "", "", "id Rest"]])
+
+        # With symbols of mixed lengths every body is separated, so none look alike
+        mixed = LL1Table({"S"}, {"i", "d", "id", "$"})
+        mixed.add_cell("S", "i", ("i", "d"))
+        mixed.add_cell("S", "id", ("id",))
+        fp = io.StringIO(newline="")
+        dump_table_csv(mixed, fp)
+        rows = list(csv.reader(io.StringIO(fp.getvalue(), newline="")))
+        self.assertEqual(rows, [["", "$", "d", "i", "id"], ["S", "", "", "i d", "id"]])
+        self.assertEqual(write_table(mixed).split("\n")[3].split(), ["S", "i", "d", "id"])
+
+    def test_case3(self) -> None:
+        """Test for the JSON table."""
+        table = self._table()
+        fp = io.StringIO()
+        dump_table_json(table, fp)
+        other = io.StringIO()
+        dump_table_json(self._reordered(table), other)
+        self.assertEqual(fp.getvalue(), other.getvalue())
+
+        data = json.loads(fp.getvalue())
+        self.assertEqual(data["terminals"], ["$", "(", ")", "*", "+", "i"])
+        self.assertEqual(data["non_terminals"], ["E", "T", "X", "Y"])
+        self.assertEqual(list(data["cells"]), ["E", "T", "X", "Y"])
+        self.assertEqual(data["cells"]["X"], {"$": [], ")": [], "+": ["+", "E"]}) # Lambda is [], empty cells are left out
+        rebuilt = LL1Table(set(data["non_terminals"]), set(data["terminals"]))
+        for nt, row in data["cells"].items():
+            for t, body in row.items():
+                rebuilt.add_cell(nt, t, body)
+        self.assertEqual(rebuilt.cells, table.cells)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import random
+import unittest
+
+from src.grammar import Grammar
+from src.utils import GrammarFormat
+
+
+class TestEdit(unittest.TestCase):
+    def _check_same_analysis(self, edited: Grammar) -> None:
+        fresh = Grammar(
+            set(edited.terminals),
+            set(edited.non_terminals),
+            {nt: list(rhs) for nt, rhs in edited.productions.items()},
+            edited.axiom,
+        )
+        for nt in edited.non_terminals:
+            self.assertEqual(edited.compute_first(nt), fresh.compute_first(nt))
+            self.assertEqual(edited.compute_follow(nt), fresh.compute_follow(nt))
+        edited_table = edited.get_ll1_table()
+        fresh_table = fresh.get_ll1_table()
+        self.assertEqual(edited_table is None, fresh_table is None)
+        if edited_table is not None:
+            self.assertEqual(edited_table.cells, fresh_table.cells)
+
+    def test_case1(self) -> None:
+        """Test for edits on an analyzed grammar."""
+        grammar_str = """
+        E -> TX
+        X -> +E
+        X ->
+        T -> iY
+        T -> (E)
+        Y -> *T
+        Y ->
+        """
+
+        grammar = GrammarFormat.read(grammar_str)
+        shared = GrammarFormat.read(grammar_str)
+        self.assertTrue(grammar.is_ll1())
+
+        grammar.add_production("T", "*i")
+        self.assertEqual(grammar.compute_first("E"), {'(', 'i', '*'})
+        self.assertEqual(grammar.get_ll1_table().cells["T"]["*"], ("*", "i"))
+        self._check_same_analysis(grammar)
+
+        grammar.add_production("X", "*E")
+        grammar.add_production("Z", "X")
+        self._check_same_analysis(grammar)
+
+        grammar.remove_production("Y", "")
+        self.assertEqual(grammar.compute_first("Y"), {'*'})
+        self.assertEqual(grammar.compute_follow("T"), {'$', ')', '+', '*'})
+        self._check_same_analysis(grammar)
+
+        table = grammar.get_ll1_table()
+        cells = {nt: dict(row) for nt, row in table.cells.items()}
+        compiled = table.compile()
+        grammar.add_production("X", "+T") # Collides with X -> +E
+        self.assertFalse(grammar.is_ll1())
+        self.assertEqual(table.cells, cells) # Tables returned before are snapshots
+        partial, _ = grammar.get_ll1_conflicts()
+        partial_cells = {nt: dict(row) for nt, row in partial.cells.items()}
+        grammar.add_production("Y", "+")
+        self.assertEqual(table.cells, cells) # Every edit, not only the first
+        self.assertEqual(partial.cells, partial_cells)
+        self.assertEqual(grammar.get_ll1_conflicts()[0].cells["Y"]["+"], ("+",))
+        grammar.remove_production("X", "+T")
+        grammar.remove_production("Y", "+")
+        self.assertTrue(grammar.is_ll1())
+        self.assertIsNot(grammar.get_ll1_table(), table)
+        self.assertEqual(grammar.get_ll1_table().cells, cells)
+        self.assertIs(table.compile(), compiled)
+
+        # Equal grammars built before the edits are not affected
+        self.assertEqual(shared.compute_first("T"), {'(', 'i'})
+        self.assertIsNone(shared.get_ll1_table().cells["T"]["*"])
+
+        with self.assertRaises(ValueError):
+            grammar.remove_production("E", "TX")
+        with self.assertRaises(ValueError):
+            grammar.remove_production("T", "TT")
+        with self.assertRaises(ValueError):
+            grammar.add_production("T", "i?")
+
+    def test_case2(self) -> None:
+        """Test for random edits against grammars built from scratch."""
+        rng = random.Random(0)
+        terminals = list("abcd")
+        for _ in range(40):
+            non_terminals = list("SABC")
+            productions = {
+                nt: ["".join(rng.choice(non_terminals + terminals) for _ in range(rng.randint(0, 3)))]
+                for nt in non_terminals
+            }
+            grammar = Grammar(set(terminals), set(non_terminals), productions, "S")
+            grammar.get_ll1_table()
+            for _ in range(5):
+                removable = [nt for nt, rhs in grammar.productions.items() if len(rhs) > 1]
+                if removable and rng.random() < 0.4:
+                    nt = rng.choice(removable)
+                    grammar.remove_production(nt, rng.choice(grammar.productions[nt]))
+                else:
+                    body = "".join(rng.choice(non_terminals + terminals) for _ in range(rng.randint(0, 3)))
+                    grammar.add_production(rng.choice(non_terminals), body)
+                self._check_same_analysis(grammar)
+
+
+if __name__ == '__main__':
+    unittest.main()
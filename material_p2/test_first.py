@@ -40,6 +40,26 @@ class TestFirst(unittest.TestCase):
         self._check_first(grammar, "YX", {'+', '*', ''})
         self._check_first(grammar, "YXT", {'+', '*', 'i', '('})
 
+    def test_case2(self) -> None:
+        """Test Case 2: mutually recursive and nullable non terminals."""
+        grammar_str = """
+        S -> ABc
+        A -> Ba
+        A ->
+        B -> Ab
+        B -> Cd
+        C -> SC
+        C ->
+        """
+
+        grammar = GrammarFormat.read(grammar_str)
+        self._check_first(grammar, "A", {'', 'b', 'd'})
+        self._check_first(grammar, "B", {'b', 'd'})
+        self._check_first(grammar, "C", {'', 'b', 'd'})
+        self._check_first(grammar, "S", {'b', 'd'})
+        self._check_first(grammar, "CA", {'', 'b', 'd'})
+        self._check_first(grammar, "CAa", {'a', 'b', 'd'})
+
 
 if __name__ == '__main__':
     unittest.main()
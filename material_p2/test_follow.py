@@ -34,6 +34,24 @@ class TestFollow(unittest.TestCase):
         self._check_follow(grammar, "X", {'$', ')'})
         self._check_follow(grammar, "Y", {'$', ')', '+'})
 
+    def test_case2(self) -> None:
+        """Test Case 2: repeated occurrences and mutually including follows."""
+        grammar_str = """
+        S -> AaAbB
+        A -> cA
+        A ->
+        B -> dC
+        B ->
+        C -> eB
+        C -> S
+        """
+
+        grammar = GrammarFormat.read(grammar_str)
+        self._check_follow(grammar, "S", {'$'})
+        self._check_follow(grammar, "A", {'a', 'b'})
+        self._check_follow(grammar, "B", {'$'})
+        self._check_follow(grammar, "C", {'$'})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,57 @@
+import itertools
+import random
+import tracemalloc
+import unittest
+
+from src.bulk_lexer import IllegalCharacterError
+from src.g1_parser import G1StreamRecognizer, get_parser, recognize_stream
+
+
+class TestG1Stream(unittest.TestCase):
+    def test_case1(self) -> None:
+        """Differential test against the PLY parser."""
+        parser = get_parser()
+        rng = random.Random(21)
+        inputs = ["".join(p) for n in range(6) for p in itertools.product("abc", repeat=n)]
+        for _ in range(300):
+            n, m, k = rng.randrange(6), rng.randrange(6), rng.randrange(8)
+            inputs.append(" " * rng.randrange(2) + "a" * n + "b" * m + "\n" + "c" * k)
+        for input_string in inputs:
+            with self.subTest(string=input_string):
+                expected = bool(parser.parse(input_string))
+                self.assertEqual(recognize_stream([input_string]), expected)
+                self.assertEqual(recognize_stream(input_string), expected) # One character per chunk
+
+    def test_case2(self) -> None:
+        """Test for multi-megabyte inputs in constant memory."""
+        n = 2 * 1024 * 1024
+        chunk = 64 * 1024
+
+        def chunks(n_c: int):
+            for symbol, count in (("a", n), ("b", n), ("c", n_c)):
+                for _ in range(count // chunk):
+                    yield symbol * chunk
+
+        tracemalloc.start()
+        try:
+            self.assertTrue(recognize_stream(chunks(n + chunk)))
+            self.assertFalse(recognize_stream(chunks(n)))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, 8 * chunk) # A few chunks, whatever the length of the input
+
+    def test_case3(self) -> None:
+        """Test for illegal characters and the counts."""
+        recognizer = G1StreamRecognizer()
+        recognizer.feed("aab")
+        recognizer.feed(b"bccc")
+        self.assertEqual((recognizer.nA, recognizer.nB, recognizer.k), (2, 2, 3))
+        self.assertTrue(recognizer.finish())
+        with self.assertRaises(IllegalCharacterError) as cm:
+            recognize_stream(["ab", "cxc"])
+        self.assertEqual(cm.exception.offset, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
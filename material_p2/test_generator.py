@@ -0,0 +1,57 @@
+import unittest
+
+from src.generator import SentenceGenerator, generate_grammar
+from src.utils import TokenGrammarFormat
+
+
+class TestGenerator(unittest.TestCase):
+    def test_case1(self) -> None:
+        """Test for generated grammars being LL(1) and reproducible."""
+        for n, nullable_ratio, recursion_ratio in ((1, 0.5, 0.5), (10, 0.0, 0.0), (50, 0.5, 0.3), (300, 0.9, 0.1)):
+            for seed in range(3):
+                with self.subTest(n=n, seed=seed):
+                    grammar = generate_grammar(n, seed=seed, nullable_ratio=nullable_ratio, recursion_ratio=recursion_ratio)
+                    self.assertEqual(len(grammar.non_terminals), n)
+                    self.assertTrue(grammar.is_ll1())
+                    again = generate_grammar(n, seed=seed, nullable_ratio=nullable_ratio, recursion_ratio=recursion_ratio)
+                    self.assertEqual(grammar.fingerprint(), again.fingerprint())
+
+        text = TokenGrammarFormat.write(grammar)
+        self.assertEqual(TokenGrammarFormat.read(text).fingerprint(), grammar.fingerprint())
+        with self.assertRaises(ValueError):
+            generate_grammar(5, separators=0)
+
+    def test_case2(self) -> None:
+        """Test for valid sentences and near misses."""
+        grammar = generate_grammar(200, seed=7, recursion_ratio=0.2)
+        table = grammar.get_ll1_table()
+        assert table is not None
+        sentences = SentenceGenerator(table, grammar.axiom, seed=7)
+        for length in (1, 50, 1000):
+            with self.subTest(length=length):
+                tokens = sentences.sentence(length)
+                self.assertEqual(tokens[-1], "$")
+                self.assertLessEqual(len(tokens) - 1, max(length, sentences.min_length[grammar.axiom]))
+                self.assertIsNotNone(table.analyze(tokens, grammar.axiom))
+                wrong = sentences.near_miss(length)
+                self.assertFalse(sentences.compiled.recognize(wrong, grammar.axiom))
+        self.assertEqual(len(sentences.sentence(1000)), 1001)
+
+    def test_case3(self) -> None:
+        """Test for the shortest sentences of generated grammars, which grow linearly with the depth."""
+        for n, seed, alternatives, max_body_length in ((60, 0, 1, 4), (42, 92, 1, 5), (200, 5, 2, 8), (1000, 1, 1, 3)):
+            with self.subTest(n=n, seed=seed, alternatives=alternatives, max_body_length=max_body_length):
+                grammar = generate_grammar(n, seed=seed, alternatives=alternatives, max_body_length=max_body_length)
+                table = grammar.get_ll1_table()
+                assert table is not None
+                sentences = SentenceGenerator(table, grammar.axiom, seed=seed)
+                shortest = sentences.min_length[grammar.axiom]
+                self.assertLessEqual(shortest, n * (2 * max_body_length + 1))
+                for length in (10, 1000):
+                    tokens = sentences.sentence(length)
+                    self.assertLessEqual(len(tokens) - 1, max(length, shortest))
+                    self.assertTrue(sentences.compiled.recognize(tokens, grammar.axiom))
+
+
+if __name__ == '__main__':
+    unittest.main()
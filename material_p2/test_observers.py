@@ -0,0 +1,99 @@
+import json
+import tracemalloc
+import unittest
+
+from src.grammar import Grammar, PhaseRecorder, analysis_cache
+from src.utils import GrammarFormat
+
+
+class TestObservers(unittest.TestCase):
+    grammar_str = """
+    E -> TX
+    X -> +E
+    X ->
+    T -> iY
+    T -> (E)
+    Y -> *T
+    Y ->
+    """
+
+    def setUp(self) -> None:
+        analysis_cache.clear() # Every test analyzes its grammars from scratch
+
+    def test_case1(self) -> None:
+        """Test for the measures of every phase."""
+        grammar = GrammarFormat.read(self.grammar_str)
+        with PhaseRecorder() as recorder:
+            table = grammar.get_ll1_table()
+            grammar.get_ll1_table() # Cached: no phase runs again
+        self.assertIsNotNone(table)
+        self.assertEqual([stats.phase for stats in recorder.records], ["first", "follow", "table"])
+
+        first, follow, fill = recorder.records
+        for stats in recorder.records:
+            with self.subTest(phase=stats.phase):
+                self.assertEqual(stats.non_terminals, 4)
+                self.assertEqual(stats.productions, 7)
+                self.assertGreaterEqual(stats.seconds, 0)
+                self.assertIsNone(stats.peak_memory)
+        self.assertGreaterEqual(first.iterations, 4) # Every non terminal is evaluated at least once
+        self.assertGreater(first.unions, 0)
+        self.assertEqual(follow.iterations, 5) # X ⊇ E, T ⊇ E, E ⊇ X, Y ⊇ T and T ⊇ Y
+        self.assertEqual(follow.unions, 6 + 5) # One per occurrence of a non terminal and per edge
+        self.assertEqual(fill.iterations, 7)
+        self.assertEqual(fill.unions, sum(body is not None for row in table.cells.values() for body in row.values()))
+
+        exported = json.loads(recorder.to_json())
+        self.assertEqual([r["phase"] for r in exported["records"]], ["first", "follow", "table"])
+        self.assertEqual(exported["records"][1]["iterations"], 5)
+        self.assertEqual(recorder.totals()["table"]["runs"], 1)
+
+        # Unregistered on exit
+        GrammarFormat.read(self.grammar_str + "Z -> i\n").get_ll1_table()
+        self.assertEqual(len(recorder.records), 3)
+        with self.assertRaises(ValueError):
+            Grammar.remove_observer(recorder)
+
+    def test_case2(self) -> None:
+        """Test for the peak memory and several observers."""
+        calls = []
+        Grammar.add_observer(calls.append)
+        try:
+            with PhaseRecorder(trace_memory=True) as recorder:
+                GrammarFormat.read(self.grammar_str).get_ll1_table()
+        finally:
+            Grammar.remove_observer(calls.append)
+        self.assertEqual(calls, recorder.records) # Every observer gets the same measures
+        for stats in recorder.records:
+            with self.subTest(phase=stats.phase):
+                self.assertIsNotNone(stats.peak_memory)
+                self.assertGreater(stats.peak_memory, 0)
+        self.assertFalse(tracemalloc.is_tracing()) # Stopped unless it was already running
+
+    def test_case3(self) -> None:
+        """Test for tracemalloc sessions of the caller and failing phases."""
+        tracemalloc.start()
+        try:
+            ballast = bytearray(10 ** 7)
+            del ballast
+            peak = tracemalloc.get_traced_memory()[1]
+            with PhaseRecorder(trace_memory=True) as recorder:
+                GrammarFormat.read(self.grammar_str).get_ll1_table()
+            self.assertTrue(tracemalloc.is_tracing())
+            self.assertGreaterEqual(tracemalloc.get_traced_memory()[1], peak) # Not reset
+            self.assertEqual(len(recorder.records), 3)
+        finally:
+            tracemalloc.stop()
+
+        analysis_cache.clear()
+        grammar = GrammarFormat.read(self.grammar_str)
+        grammar._first_sets = lambda: 1 / 0
+        with PhaseRecorder(trace_memory=True) as recorder:
+            with self.assertRaises(ZeroDivisionError):
+                grammar.compute_first("E")
+        self.assertFalse(tracemalloc.is_tracing()) # Stopped even if the phase fails
+        self.assertEqual(recorder.records, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+from src.g1_lexer import lexer as g1_lexer
+from src.grammar import SyntaxError
+from src.ply_adapter import analyze_tokens, lexer_tokens, recognize_tokens
+from src.utils import TokenGrammarFormat
+
+
+class TestPlyAdapter(unittest.TestCase):
+    grammar_str = """
+    S -> A B C
+    A -> a A
+    A ->
+    B -> b B
+    B ->
+    C -> c D
+    D -> c D
+    D ->
+    """
+
+    def test_case1(self) -> None:
+        """Test for the tokens of a PLY lexer analyzed with an LL(1) table."""
+        table = TokenGrammarFormat.read(self.grammar_str).get_ll1_table()
+        assert table is not None
+        lexer = g1_lexer.clone()
+
+        self.assertEqual(list(lexer_tokens(lexer, "ab c\n")), ["a", "b", "c", "$"])
+        tree = analyze_tokens(table, lexer, "aa bb ccc", "S")
+        self.assertEqual(tree, table.analyze("aabbccc$", "S"))
+        self.assertTrue(recognize_tokens(table.compile(), lexer, "c", "S"))
+        for input_string in ("", "ab", "abca", "ba c"):
+            with self.subTest(string=input_string):
+                self.assertFalse(recognize_tokens(table, lexer, input_string, "S"))
+                with self.assertRaises(SyntaxError):
+                    analyze_tokens(table, lexer, input_string, "S")
+
+        with mock.patch("src.grammar.CompiledLL1Table", side_effect=AssertionError): # Compiled once, above
+            self.assertTrue(recognize_tokens(table, lexer, "abc", "S"))
+            self.assertIsNotNone(analyze_tokens(table, lexer, "abc", "S"))
+
+        renamed = TokenGrammarFormat.read(self.grammar_str.replace("a", "x"))
+        self.assertTrue(recognize_tokens(renamed.get_ll1_table(), lexer, "aac", "S", type_map={"a": "x"}))
+
+    def test_case2(self) -> None:
+        """Test for lexing interleaved with parsing."""
+        table = TokenGrammarFormat.read(self.grammar_str).get_ll1_table()
+        assert table is not None
+        lexer = g1_lexer.clone()
+        data = "ca" + "a" * 10000
+
+        self.assertFalse(recognize_tokens(table, lexer, data, "S"))
+        self.assertLess(lexer.lexpos, 10) # The lexer stopped right after the wrong token
+
+    def test_case3(self) -> None:
+        """Test for illegal characters."""
+        table = TokenGrammarFormat.read(self.grammar_str).get_ll1_table()
+        assert table is not None
+        lexer = g1_lexer.clone()
+
+        with contextlib.redirect_stdout(io.StringIO()): # t_error prints the character
+            for input_string in ("ax", "cx", "x"):
+                with self.subTest(string=input_string):
+                    self.assertFalse(recognize_tokens(table, lexer, input_string, "S"))
+            with self.assertRaises(Exception):
+                analyze_tokens(table, lexer, "ax", "S")
+        self.assertTrue(recognize_tokens(table, lexer, "ac", "S"))
+        with self.assertRaises(ValueError): # Errors of the analysis itself are not hidden
+            recognize_tokens(table, lexer, "ac", "Z")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+class TestPlyBuild(unittest.TestCase):
+    def _run(self, code: str, cwd: str) -> str:
+        env = dict(os.environ, PYTHONPATH=ROOT, PYTHONDONTWRITEBYTECODE="1")
+        return subprocess.run(
+            [sys.executable, "-c", code], cwd=cwd, env=env, check=True, capture_output=True, text=True,
+        ).stdout
+
+    def test_case1(self) -> None:
+        """Test for parsers built on first use, without writing any file."""
+        code = (
+            "import sys\n"
+            "import src.g1_parser, src.roman_parser\n"
+            "print('ply.yacc' in sys.modules)\n"
+            "print(src.g1_parser.parser.parse('aabbccc'), src.roman_parser.parser.parse('XIV')['val'])\n"
+        )
+        src_dir = os.path.join(ROOT, "src")
+        before = sorted(os.listdir(src_dir))
+        with tempfile.TemporaryDirectory() as cwd:
+            self.assertEqual(self._run(code, cwd).split(), ["False", "True", "14"])
+            self.assertEqual(os.listdir(cwd), [])
+        self.assertEqual(sorted(os.listdir(src_dir)), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
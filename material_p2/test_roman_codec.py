@@ -0,0 +1,50 @@
+import itertools
+import random
+import unittest
+from array import array
+
+from src import roman_codec
+from src.roman_parser import get_parser
+
+
+class TestRomanCodec(unittest.TestCase):
+    def _parse(self, numeral: str) -> int:
+        result = get_parser().parse(numeral)
+        return result["val"] if result is not None and result["valid"] else -1
+
+    def test_case1(self) -> None:
+        """Differential test against the attribute grammar."""
+        rng = random.Random(22)
+        numerals = ["".join(p) for n in range(5) for p in itertools.product("MDCLXVI", repeat=n)]
+        numerals += [roman_codec.encode(v) for v in range(roman_codec.MAX_VALUE + 1)]
+        numerals += ["".join(rng.choice("MDCLXVI") for _ in range(rng.randrange(5, 12))) for _ in range(500)]
+        numerals += [" X IV", "C\tM\n"]
+
+        values = roman_codec.decode_many(numerals)
+        for numeral, value in zip(numerals, values):
+            with self.subTest(numeral=numeral):
+                self.assertEqual(value, self._parse(numeral))
+                if value < 0:
+                    with self.assertRaises(ValueError):
+                        roman_codec.decode(numeral)
+                else:
+                    self.assertEqual(roman_codec.decode(numeral), value)
+
+    def test_case2(self) -> None:
+        """Test for the encoder and the bulk functions."""
+        values = array("i", range(roman_codec.MAX_VALUE + 1))
+        numerals = roman_codec.encode_many(values)
+        self.assertEqual(numerals[14], "XIV")
+        self.assertEqual(numerals[0], "")
+        self.assertEqual(roman_codec.decode_many(numerals), values)
+        self.assertEqual(roman_codec.decode_many(iter(["CD", "MM", "X?"])), array("i", [400, -1, -1]))
+        self.assertEqual(roman_codec.encode_many(v for v in (9, 90)), ["IX", "XC"])
+        for wrong in (-1, 1000):
+            with self.assertRaises(ValueError):
+                roman_codec.encode(wrong)
+            with self.assertRaises(ValueError):
+                roman_codec.encode_many([1, wrong])
+
+
+if __name__ == '__main__':
+    unittest.main()
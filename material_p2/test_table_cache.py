@@ -0,0 +1,108 @@
+import os
+import tempfile
+import unittest
+
+from src.grammar import AnalysisCache, Grammar, analysis_cache
+from src.table_cache import get_cached_ll1_table
+from src.utils import GrammarFormat
+
+
+class TestTableCache(unittest.TestCase):
+    grammar_str = """
+    E -> TX
+    X -> +E
+    X ->
+    T -> iY
+    T -> (E)
+    Y -> *T
+    Y ->
+    """
+
+    def test_case1(self) -> None:
+        """Test for cache misses, hits and rebuilds."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            grammar = GrammarFormat.read(self.grammar_str)
+            table = get_cached_ll1_table(grammar, cache_dir)
+            self.assertIsNotNone(table)
+            entries = os.listdir(cache_dir)
+            self.assertEqual(len(entries), 1)
+
+            # A hit must not analyze the grammar again
+            cached = GrammarFormat.read(self.grammar_str)
+            cached.get_ll1_table = None
+            hit = get_cached_ll1_table(cached, cache_dir)
+            self.assertEqual(hit.cells, table.cells)
+            self.assertEqual(hit.terminals, table.terminals)
+            self.assertEqual(hit.non_terminals, table.non_terminals)
+            self.assertEqual(
+                hit.analyze("i*i$", "E"), table.analyze("i*i$", "E"),
+            )
+
+            # A corrupt entry is detected and rebuilt
+            path = os.path.join(cache_dir, entries[0])
+            with open(path, "r+b") as f:
+                f.seek(-3, os.SEEK_END)
+                f.write(b"xyz")
+            rebuilt = get_cached_ll1_table(grammar, cache_dir)
+            self.assertEqual(rebuilt.cells, table.cells)
+            self.assertEqual(get_cached_ll1_table(cached, cache_dir).cells, table.cells)
+
+    def test_case2(self) -> None:
+        """Test for fingerprints and non LL(1) grammars."""
+        grammar = GrammarFormat.read(self.grammar_str)
+        reordered = Grammar(
+            set(grammar.terminals),
+            set(grammar.non_terminals),
+            {nt: list(reversed(rhs)) for nt, rhs in reversed(grammar.productions.items())},
+            grammar.axiom,
+        )
+        self.assertEqual(grammar.fingerprint(), reordered.fingerprint())
+        other = GrammarFormat.read(self.grammar_str.replace("*T", "/T"))
+        self.assertNotEqual(grammar.fingerprint(), other.fingerprint())
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            ambiguous = GrammarFormat.read("""
+            S -> aS
+            S -> a
+            """)
+            self.assertIsNone(get_cached_ll1_table(ambiguous, cache_dir))
+            self.assertIsNone(get_cached_ll1_table(ambiguous, cache_dir))
+
+
+class TestAnalysisCache(unittest.TestCase):
+    grammar_str = TestTableCache.grammar_str
+
+    def test_case1(self) -> None:
+        """Test for analyses shared between equal grammars."""
+        analysis_cache.clear()
+        first = GrammarFormat.read(self.grammar_str)
+        table = first.get_ll1_table()
+        self.assertEqual(analysis_cache.cache_info().misses, 1)
+
+        second = GrammarFormat.read(self.grammar_str)
+        self.assertIs(second.get_ll1_table(), table)
+        self.assertIs(second.get_compiled_ll1_table(), first.get_compiled_ll1_table())
+        self.assertTrue(second.is_ll1())
+        self.assertEqual(second.compute_follow("T"), {'$', ')', '+'})
+        info = analysis_cache.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+        other = GrammarFormat.read(self.grammar_str.replace("*T", "/T"))
+        self.assertIsNot(other.get_ll1_table(), table)
+        self.assertEqual(analysis_cache.cache_info().misses, 2)
+
+    def test_case2(self) -> None:
+        """Test for least recently used eviction."""
+        cache = AnalysisCache(maxsize=2)
+        a = cache.get("a")
+        cache.get("b")
+        self.assertIs(cache.get("a"), a)
+        cache.get("c") # Evicts "b"
+        self.assertIs(cache.get("a"), a)
+        cache.get("b")
+        info = cache.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 4, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.g1_parser import get_parser as get_g1_parser
+from src.roman_parser import get_parser as get_roman_parser
+from src.ply_build import ParseContext
+
+
+class TestThreads(unittest.TestCase):
+    def setUp(self) -> None:
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6) # Switch threads as often as possible
+
+    def tearDown(self) -> None:
+        sys.setswitchinterval(self.switch_interval)
+
+    def test_case1(self) -> None:
+        """Stress test: valid and invalid strings of both grammars parsed concurrently."""
+        g1 = get_g1_parser()
+        roman = get_roman_parser()
+        cases = [
+            (g1, "aabbccc", True),
+            (g1, "a" * 50 + "b" * 50 + "c" * 51, True),
+            (g1, "bbaaccc", False), # Syntax error
+            (g1, "abcabc", False),
+            (g1, "aabbcc", False),
+            (roman, "XIV", {"val": 14, "valid": True}),
+            (roman, "CMXCIX", {"val": 999, "valid": True}),
+            (roman, "IXI", {"val": -1, "valid": False}), # Syntax error
+            (roman, "IIII", {"val": -1, "valid": False}),
+            (roman, "XX", {"val": 20, "valid": True}),
+        ]
+        jobs = cases * 100
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda job: job[0].parse(job[1]), jobs))
+        for (_, input_string, expected), result in zip(jobs, results):
+            self.assertEqual(result, expected, input_string)
+
+    def test_case2(self) -> None:
+        """Test for the error state kept in the context of every parse."""
+        roman = get_roman_parser()
+        context = ParseContext()
+        self.assertEqual(roman.parse("IXI", context=context)["valid"], False)
+        self.assertTrue(context.error)
+        self.assertEqual(roman.parse("IX"), {"val": 9, "valid": True}) # Nothing left from the previous error
+
+
+if __name__ == '__main__':
+    unittest.main()